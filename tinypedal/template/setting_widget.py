@@ -1780,6 +1780,7 @@ WIDGET_DEFAULT = {
         "display_height": 60,
         "display_margin": 2,
         "display_scale": 2,
+        "enable_antialiasing": False,
         "show_inverted_pedal": False,
         "show_inverted_trailing": True,
         "show_throttle": True,
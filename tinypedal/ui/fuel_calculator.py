@@ -264,6 +264,10 @@ class FuelCalculator(QDialog):
         self.usage_energy = OutputUsage(frame_output_energy, "Energy")
         self.refill_fuel = OutputRefill(self, frame_output_start_fuel, "Fuel")
         self.refill_energy = OutputRefill(self, frame_output_start_energy, "Energy")
+        self.output_set = {
+            "fuel": (self.usage_fuel, self.refill_fuel),
+            "energy": (self.usage_energy, self.refill_energy),
+        }
 
         button_reload = QPushButton("Reload")
         button_reload.clicked.connect(self.reload_data)
@@ -419,28 +423,24 @@ class FuelCalculator(QDialog):
         else:
             average_refuel = 0
 
+        # Clamp negative output
+        estimate_pit_counts = max(estimate_pit_counts, 0)
+        minimum_pit_counts = max(minimum_pit_counts, 0)
+        used_one_less = max(used_one_less, 0)
+
         # Output
-        if output_type == "fuel":
-            output_usage = self.usage_fuel
-            output_refill = self.refill_fuel
-        else:
-            output_usage = self.usage_energy
-            output_refill = self.refill_energy
-
-        output_usage.total_needed.setText(
-            f"{total_need_frac:.3f} ≈ {total_need_full}")
-        output_usage.end_stint.setText(
-            f"{end_stint_fuel:.3f}")
-        output_usage.pit_stops.setText(
-            f"{max(estimate_pit_counts, 0):.3f} ≈ {max(math.ceil(minimum_pit_counts), 0)}")
-        output_usage.one_less_stint.setText(
-            f"{max(used_one_less, 0):.3f}")
-        output_usage.total_laps.setText(
-            f"{total_runlaps:.3f}")
-        output_usage.total_minutes.setText(
-            f"{total_runmins:.3f}")
-        output_refill.average_refill.setText(
-            f"{average_refuel:.3f}")
+        output_usage, output_refill = self.output_set[output_type]
+        output_text = (
+            (output_usage.total_needed, f"{total_need_frac:.3f} ≈ {total_need_full}"),
+            (output_usage.end_stint, f"{end_stint_fuel:.3f}"),
+            (output_usage.pit_stops, f"{estimate_pit_counts:.3f} ≈ {minimum_pit_counts}"),
+            (output_usage.one_less_stint, f"{used_one_less:.3f}"),
+            (output_usage.total_laps, f"{total_runlaps:.3f}"),
+            (output_usage.total_minutes, f"{total_runmins:.3f}"),
+            (output_refill.average_refill, f"{average_refuel:.3f}"),
+        )
+        for line_edit, text in output_text:
+            line_edit.setText(text)
         # Set warning color if exceeded tank capacity
         set_read_only_style(
             output_refill.average_refill, average_refuel > tank_capacity)
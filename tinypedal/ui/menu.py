@@ -22,6 +22,7 @@ Menu
 
 import os
 
+from PySide2.QtCore import Qt
 from PySide2.QtGui import QDesktopServices
 from PySide2.QtWidgets import QMenu, QAction, QMessageBox
 
@@ -36,6 +37,54 @@ from .heatmap_editor import HeatmapEditor
 from .vehicle_brand_editor import VehicleBrandEditor
 from .vehicle_class_editor import VehicleClassEditor
 
+# Menu action tables: (label, slot name), None label adds separator
+RESET_DATA_ACTIONS = (
+    ("Delta best", "reset_deltabest"),
+    ("Energy delta", "reset_energydelta"),
+    ("Fuel delta", "reset_fueldelta"),
+    ("Sector best", "reset_sectorbest"),
+    ("Track map", "reset_trackmap"),
+)
+CONFIG_ACTIONS = (
+    ("Application", "open_config_application"),
+    ("User path", "open_config_userpath"),
+    (None, None),
+    ("Units and symbols", "open_config_units"),
+    ("Global font override", "open_config_font"),
+    ("Shared memory API", "open_config_sharedmemory"),
+    ("Compatibility", "open_config_compatibility"),
+)
+TOOLS_ACTIONS = (
+    ("Fuel calculator", "open_editor_fuel"),
+    ("Heatmap editor", "open_editor_heatmap"),
+    ("Vehicle brand editor", "open_editor_brands"),
+    ("Vehicle class editor", "open_editor_classes"),
+)
+HELP_ACTIONS = (
+    ("User guide", "open_user_guide"),
+    ("FAQ", "open_faq"),
+    ("Show log", "show_log"),
+    (None, None),
+    ("About", "show_about"),
+)
+
+
+def refresh_checked(action: QAction, state: bool):
+    """Set action checked state only if changed"""
+    if action.isChecked() != state:
+        action.setChecked(state)
+
+
+def add_actions(parent: QMenu, menu: QMenu, action_list: tuple):
+    """Add actions from action table to menu, connect to parent slots"""
+    for label, slot in action_list:
+        if label is None:
+            menu.addSeparator()
+            continue
+        action = QAction(label, parent)
+        action.triggered.connect(getattr(parent, slot), Qt.DirectConnection)
+        menu.addAction(action)
+
 
 class OverlayMenu(QMenu):
     """Overlay menu, shared between main & tray menu"""
@@ -48,32 +97,32 @@ class OverlayMenu(QMenu):
         self.overlay_lock = QAction("Lock overlay", self)
         self.overlay_lock.setCheckable(True)
         self.overlay_lock.setChecked(cfg.overlay["fixed_position"])
-        self.overlay_lock.triggered.connect(self.is_locked)
+        self.overlay_lock.triggered.connect(self.is_locked, Qt.DirectConnection)
         menu.addAction(self.overlay_lock)
 
         # Auto hide
         self.overlay_hide = QAction("Auto hide", self)
         self.overlay_hide.setCheckable(True)
         self.overlay_hide.setChecked(cfg.overlay["auto_hide"])
-        self.overlay_hide.triggered.connect(self.is_hidden)
+        self.overlay_hide.triggered.connect(self.is_hidden, Qt.DirectConnection)
         menu.addAction(self.overlay_hide)
 
         # Grid move
         self.overlay_grid = QAction("Grid move", self)
         self.overlay_grid.setCheckable(True)
         self.overlay_grid.setChecked(cfg.overlay["enable_grid_move"])
-        self.overlay_grid.triggered.connect(self.has_grid)
+        self.overlay_grid.triggered.connect(self.has_grid, Qt.DirectConnection)
         menu.addAction(self.overlay_grid)
 
         # Reload preset
         reload_preset = QAction("Reload", self)
-        reload_preset.triggered.connect(self.master.reload_preset)
+        reload_preset.triggered.connect(self.master.reload_preset, Qt.DirectConnection)
         menu.addAction(reload_preset)
         menu.addSeparator()
 
         # Restart API
         restart_api = QAction("Restart API", self)
-        restart_api.triggered.connect(self.master.restart_api)
+        restart_api.triggered.connect(self.master.restart_api, Qt.DirectConnection)
         menu.addAction(restart_api)
         menu.addSeparator()
 
@@ -87,9 +136,10 @@ class OverlayMenu(QMenu):
 
     def refresh_overlay_menu(self):
         """Refresh overlay menu"""
-        self.overlay_lock.setChecked(cfg.overlay["fixed_position"])
-        self.overlay_hide.setChecked(cfg.overlay["auto_hide"])
-        self.overlay_grid.setChecked(cfg.overlay["enable_grid_move"])
+        overlay = cfg.overlay
+        refresh_checked(self.overlay_lock, overlay["fixed_position"])
+        refresh_checked(self.overlay_hide, overlay["auto_hide"])
+        refresh_checked(self.overlay_grid, overlay["enable_grid_move"])
 
     @staticmethod
     def is_locked():
@@ -114,30 +164,7 @@ class ResetDataMenu(QMenu):
         super().__init__(master)
         self.master = master
 
-        # Deltabest
-        reset_deltabest = QAction("Delta best", self)
-        reset_deltabest.triggered.connect(self.reset_deltabest)
-        menu.addAction(reset_deltabest)
-
-        # Energy delta
-        reset_energydelta = QAction("Energy delta", self)
-        reset_energydelta.triggered.connect(self.reset_energydelta)
-        menu.addAction(reset_energydelta)
-
-        # Fuel delta
-        reset_fueldelta = QAction("Fuel delta", self)
-        reset_fueldelta.triggered.connect(self.reset_fueldelta)
-        menu.addAction(reset_fueldelta)
-
-        # Sector best
-        reset_sectorbest = QAction("Sector best", self)
-        reset_sectorbest.triggered.connect(self.reset_sectorbest)
-        menu.addAction(reset_sectorbest)
-
-        # Track map
-        reset_trackmap = QAction("Track map", self)
-        reset_trackmap.triggered.connect(self.reset_trackmap)
-        menu.addAction(reset_trackmap)
+        add_actions(self, menu, RESET_DATA_ACTIONS)
 
     def reset_deltabest(self):
         """Reset deltabest data"""
@@ -166,6 +193,7 @@ class ResetDataMenu(QMenu):
 
     def __confirmation(self, data_type: str, file_ext: str, file_path: str, combo_name: str):
         """Message confirmation"""
+        data_file = f"{file_path}{combo_name}.{file_ext}"
         # Check if on track
         if api.state:
             QMessageBox.warning(
@@ -173,7 +201,7 @@ class ResetDataMenu(QMenu):
                 "Cannot reset data while on track.")
             return None
         # Check if file exist
-        if not os.path.exists(f"{file_path}{combo_name}.{file_ext}"):
+        if not os.path.isfile(data_file):
             QMessageBox.warning(
                 self.master, "Error",
                 f"No {data_type} data found.<br><br>You can only reset data from active session.")
@@ -188,7 +216,7 @@ class ResetDataMenu(QMenu):
             self.master, f"Reset {data_type.title()}", message_text,
             buttons=QMessageBox.Yes | QMessageBox.No)
         if delete_msg == QMessageBox.Yes:
-            os.remove(f"{file_path}{combo_name}.{file_ext}")
+            os.remove(data_file)
             QMessageBox.information(
                 self.master, f"Reset {data_type.title()}",
                 f"{data_type.capitalize()} data has been reset for<br><b>{combo_name}</b>")
@@ -203,31 +231,7 @@ class ConfigMenu(QMenu):
         super().__init__(master)
         self.master = master
 
-        config_app = QAction("Application", self)
-        config_app.triggered.connect(self.open_config_application)
-        menu.addAction(config_app)
-
-        config_userpath = QAction("User path", self)
-        config_userpath.triggered.connect(self.open_config_userpath)
-        menu.addAction(config_userpath)
-
-        menu.addSeparator()
-
-        config_units = QAction("Units and symbols", self)
-        config_units.triggered.connect(self.open_config_units)
-        menu.addAction(config_units)
-
-        config_font = QAction("Global font override", self)
-        config_font.triggered.connect(self.open_config_font)
-        menu.addAction(config_font)
-
-        config_sharedmemory = QAction("Shared memory API", self)
-        config_sharedmemory.triggered.connect(self.open_config_sharedmemory)
-        menu.addAction(config_sharedmemory)
-
-        config_compat = QAction("Compatibility", self)
-        config_compat.triggered.connect(self.open_config_compatibility)
-        menu.addAction(config_compat)
+        add_actions(self, menu, CONFIG_ACTIONS)
 
     def open_config_application(self):
         """Config global application"""
@@ -277,21 +281,7 @@ class ToolsMenu(QMenu):
         super().__init__(master)
         self.master = master
 
-        editor_fuel = QAction("Fuel calculator", self)
-        editor_fuel.triggered.connect(self.open_editor_fuel)
-        menu.addAction(editor_fuel)
-
-        editor_heatmap = QAction("Heatmap editor", self)
-        editor_heatmap.triggered.connect(self.open_editor_heatmap)
-        menu.addAction(editor_heatmap)
-
-        editor_brands = QAction("Vehicle brand editor", self)
-        editor_brands.triggered.connect(self.open_editor_brands)
-        menu.addAction(editor_brands)
-
-        editor_classes = QAction("Vehicle class editor", self)
-        editor_classes.triggered.connect(self.open_editor_classes)
-        menu.addAction(editor_classes)
+        add_actions(self, menu, TOOLS_ACTIONS)
 
     def open_editor_fuel(self):
         """Fuel calculator"""
@@ -324,21 +314,21 @@ class WindowMenu(QMenu):
         self.show_window = QAction("Show at startup", self)
         self.show_window.setCheckable(True)
         self.show_window.setChecked(cfg.application["show_at_startup"])
-        self.show_window.triggered.connect(self.is_show_at_startup)
+        self.show_window.triggered.connect(self.is_show_at_startup, Qt.DirectConnection)
         menu.addAction(self.show_window)
 
         # Minimize to tray
         self.minimize_to_tray = QAction("Minimize to tray", self)
         self.minimize_to_tray.setCheckable(True)
         self.minimize_to_tray.setChecked(cfg.application["minimize_to_tray"])
-        self.minimize_to_tray.triggered.connect(self.is_minimize_to_tray)
+        self.minimize_to_tray.triggered.connect(self.is_minimize_to_tray, Qt.DirectConnection)
         menu.addAction(self.minimize_to_tray)
 
         # Remember position
         self.remember_position = QAction("Remember position", self)
         self.remember_position.setCheckable(True)
         self.remember_position.setChecked(cfg.application["remember_position"])
-        self.remember_position.triggered.connect(self.is_remember_position)
+        self.remember_position.triggered.connect(self.is_remember_position, Qt.DirectConnection)
         menu.addAction(self.remember_position)
 
         # Refresh menu
@@ -346,9 +336,10 @@ class WindowMenu(QMenu):
 
     def refresh_menu(self):
         """Refresh window menu"""
-        self.show_window.setChecked(cfg.application["show_at_startup"])
-        self.minimize_to_tray.setChecked(cfg.application["minimize_to_tray"])
-        self.remember_position.setChecked(cfg.application["remember_position"])
+        application = cfg.application
+        refresh_checked(self.show_window, application["show_at_startup"])
+        refresh_checked(self.minimize_to_tray, application["minimize_to_tray"])
+        refresh_checked(self.remember_position, application["remember_position"])
 
     @staticmethod
     def is_show_at_startup():
@@ -376,22 +367,7 @@ class HelpMenu(QMenu):
         super().__init__(master)
         self.master = master
 
-        app_guide = QAction("User guide", self)
-        app_guide.triggered.connect(self.open_user_guide)
-        menu.addAction(app_guide)
-
-        app_faq = QAction("FAQ", self)
-        app_faq.triggered.connect(self.open_faq)
-        menu.addAction(app_faq)
-
-        app_log = QAction("Show log", self)
-        app_log.triggered.connect(self.show_log)
-        menu.addAction(app_log)
-
-        menu.addSeparator()
-        app_about = QAction("About", self)
-        app_about.triggered.connect(self.show_about)
-        menu.addAction(app_about)
+        add_actions(self, menu, HELP_ACTIONS)
 
     def show_about(self):
         """Show about"""
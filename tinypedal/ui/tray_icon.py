@@ -20,6 +20,7 @@
 Tray icon
 """
 
+from PySide2.QtCore import Qt
 from PySide2.QtGui import QIcon
 from PySide2.QtWidgets import QSystemTrayIcon, QMenu, QAction
 
@@ -52,22 +53,16 @@ class TrayIcon(QSystemTrayIcon):
         menu.addAction(self.loaded_preset)
         menu.addSeparator()
 
-        # Overlay menu
-        OverlayMenu(self.master, menu)
-        menu.addSeparator()
-
         # Config
-        app_config = QAction("Config", self)
-        app_config.triggered.connect(self.show_config)
-        menu.addAction(app_config)
-        menu.addSeparator()
+        self.app_config = QAction("Config", self)
+        self.app_config.triggered.connect(self.show_config, Qt.DirectConnection)
 
         # Quit
-        app_quit = QAction("Quit", self)
-        app_quit.triggered.connect(self.master.quit_app)
-        menu.addAction(app_quit)
+        self.app_quit = QAction("Quit", self)
+        self.app_quit.triggered.connect(self.master.quit_app, Qt.DirectConnection)
 
         self.setContextMenu(menu)
+        menu.aboutToShow.connect(self.create_menu)
         menu.aboutToShow.connect(self.refresh_menu)
 
     def show_config(self):
@@ -80,6 +75,22 @@ class TrayIcon(QSystemTrayIcon):
         if active_reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_config()
 
+    def create_menu(self):
+        """Create remaining menu on first show"""
+        menu = self.contextMenu()
+        menu.aboutToShow.disconnect(self.create_menu)
+
+        # Overlay menu
+        OverlayMenu(self.master, menu)
+        menu.addSeparator()
+
+        # Config
+        menu.addAction(self.app_config)
+        menu.addSeparator()
+
+        # Quit
+        menu.addAction(self.app_quit)
+
     def refresh_menu(self):
         """Refresh menu"""
         self.loaded_preset.setText(
@@ -90,5 +101,5 @@ class TrayIcon(QSystemTrayIcon):
         """Format preset name"""
         loaded_preset = filename[:-5]
         if len(loaded_preset) > 16:
-            loaded_preset = f"{loaded_preset[:16]}..."
+            return loaded_preset[:16] + "..."
         return loaded_preset
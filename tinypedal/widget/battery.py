@@ -45,6 +45,7 @@ class Realtime(Overlay):
         bar_gap = self.wcfg["bar_gap"]
         bar_width = font_m.width * 8 + bar_padx
         self.freeze_duration = min(max(self.wcfg["freeze_duration"], 0), 30)
+        self.low_battery_threshold = self.wcfg["low_battery_threshold"]
 
         # Base style
         self.setStyleSheet(self.set_qss(
@@ -129,10 +130,10 @@ class Realtime(Overlay):
             )
 
         # Last data
-        self.last_battery_charge = None
-        self.last_battery_drain = None
-        self.last_battery_regen = None
-        self.last_active_timer = None
+        self.last_battery_charge = -1
+        self.last_battery_drain = -1
+        self.last_battery_regen = -1
+        self.last_active_timer = -1
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -171,7 +172,7 @@ class Realtime(Overlay):
         if curr != last:
             self.bar_charge.setText(f"B{curr: >7.2f}"[:8])
             self.bar_charge.setStyleSheet(
-                self.bar_style_charge[curr <= self.wcfg["low_battery_threshold"]])
+                self.bar_style_charge[curr <= self.low_battery_threshold])
 
     def update_drain(self, curr, last):
         """Battery drain"""
@@ -51,11 +51,30 @@ class Realtime(Overlay):
         self.leading_zero = min(max(self.wcfg["leading_zero"], 1), 3)
         self.sign_text = "°" if self.wcfg["show_degree_sign"] else ""
 
+        if self.cfg.units["temperature_unit"] == "Fahrenheit":
+            self.round_temperature = self.round_fahrenheit
+        else:
+            self.round_temperature = round
+
         text_width = 3 + len(self.sign_text) + (self.cfg.units["temperature_unit"] == "Fahrenheit")
         bar_width_temp = font_m.width * text_width + bar_padx
 
         # Base style
         self.heatmap = hmp.load_heatmap(self.wcfg["heatmap_name"], "brake_default")
+        if self.wcfg["swap_style"]:
+            self.bar_style_heatmap = {
+                color: self.set_qss(
+                    fg_color=color,
+                    bg_color=self.wcfg["bkg_color_temperature"])
+                for _, color in self.heatmap
+            }
+        else:
+            self.bar_style_heatmap = {
+                color: self.set_qss(
+                    fg_color=self.wcfg["font_color_temperature"],
+                    bg_color=color)
+                for _, color in self.heatmap
+            }
         self.setStyleSheet(self.set_qss(
             font_family=self.wcfg["font_name"],
             font_size=self.wcfg["font_size"],
@@ -117,8 +136,10 @@ class Realtime(Overlay):
         self.last_lap_stime = 0
         self.btavg_samples = 1  # number of temperature samples
 
-        self.last_btemp = [-273.15] * 4
+        self.last_btemp = (-274,) * 4
+        self.last_color_btemp = [None] * 4
         self.last_btavg = [0] * 4
+        self.last_highlighted_btavg = [0] * 4
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -130,9 +151,11 @@ class Realtime(Overlay):
 
             # Brake temperature
             btemp = api.read.brake.temperature()
-            for idx in range(4):
-                self.update_btemp(self.bar_btemp[idx], btemp[idx], self.last_btemp[idx])
-                self.last_btemp[idx] = btemp[idx]
+            btemp_rounded = tuple(map(self.round_temperature, btemp))
+            if btemp_rounded != self.last_btemp:
+                for idx in range(4):
+                    self.update_btemp(idx, btemp[idx], btemp_rounded[idx], self.last_btemp[idx])
+                self.last_btemp = btemp_rounded
 
             # Brake average temperature
             if self.wcfg["show_average"]:
@@ -141,16 +164,15 @@ class Realtime(Overlay):
                 if lap_stime != self.last_lap_stime:  # time stamp difference
                     self.last_lap_stime = lap_stime  # reset time stamp counter
                     self.btavg_samples = 1
-                    # Highlight reading
-                    for idx in range(4):
-                        self.update_btavg(self.bar_btavg[idx], self.last_btavg[idx], 0, 1)
+                    self.highlight_btavg()
 
                 # Update average reading
                 self.btavg_samples += 1
+                is_highlight_over = minfo.delta.lapTimeCurrent >= self.wcfg["highlight_duration"]
                 for idx in range(4):
                     btavg = calc.mean_iter(self.last_btavg[idx], btemp[idx], self.btavg_samples)
-                    if minfo.delta.lapTimeCurrent >= self.wcfg["highlight_duration"]:
-                        self.update_btavg(self.bar_btavg[idx], btavg, self.last_btavg[idx])
+                    if is_highlight_over:
+                        self.update_btavg(idx, btavg, self.last_btavg[idx])
                     self.last_btavg[idx] = btavg
 
         else:
@@ -160,23 +182,38 @@ class Realtime(Overlay):
                 self.last_btavg = [0] * 4
 
     # GUI update methods
-    def update_btemp(self, target_bar, curr, last):
-        """Brake temperature"""
-        if round(curr) != round(last):
-            color_temp = hmp.select_color(self.heatmap, curr)
-            if self.wcfg["swap_style"]:
-                color = f"color: {color_temp};background: {self.wcfg['bkg_color_temperature']};"
-            else:
-                color = f"color: {self.wcfg['font_color_temperature']};background: {color_temp};"
-
+    def update_btemp(self, idx, value, curr, last):
+        """Brake temperature, compare rounded reading in display unit"""
+        if curr != last:
+            target_bar = self.bar_btemp[idx]
             target_bar.setText(self.format_temperature(curr))
-            target_bar.setStyleSheet(color)
+            color_temp = hmp.select_color(self.heatmap, value)
+            if color_temp != self.last_color_btemp[idx]:
+                target_bar.setStyleSheet(self.bar_style_heatmap[color_temp])
+                self.last_color_btemp[idx] = color_temp
 
-    def update_btavg(self, target_bar, curr, last, highlighted=0):
+    def highlight_btavg(self):
+        """Brake average temperature - highlight last lap reading
+
+        Skip bar if no average reading sampled yet.
+        """
+        for idx, target_bar in enumerate(self.bar_btavg):
+            btavg = self.last_btavg[idx]
+            if round(btavg) == 0:
+                continue
+            target_bar.setText(self.format_temperature(self.round_temperature(btavg)))
+            target_bar.setStyleSheet(self.bar_style_btavg[1])
+            self.last_highlighted_btavg[idx] = 1
+
+    def update_btavg(self, idx, curr, last):
         """Brake average temperature"""
-        if round(curr) != round(last):
+        curr = self.round_temperature(curr)
+        if curr != self.round_temperature(last):
+            target_bar = self.bar_btavg[idx]
             target_bar.setText(self.format_temperature(curr))
-            target_bar.setStyleSheet(self.bar_style_btavg[highlighted])
+            if self.last_highlighted_btavg[idx]:
+                target_bar.setStyleSheet(self.bar_style_btavg[0])
+                self.last_highlighted_btavg[idx] = 0
 
     # GUI generate methods
     @staticmethod
@@ -191,7 +228,10 @@ class Realtime(Overlay):
 
     # Additional methods
     def format_temperature(self, value):
-        """Format temperature"""
-        if self.cfg.units["temperature_unit"] == "Fahrenheit":
-            return f"{calc.celsius2fahrenheit(value):0{self.leading_zero}.0f}{self.sign_text}"
-        return f"{value:0{self.leading_zero}.0f}{self.sign_text}"
+        """Format rounded temperature"""
+        return f"{value:0{self.leading_zero}d}{self.sign_text}"
+
+    @staticmethod
+    def round_fahrenheit(value):
+        """Round temperature - Fahrenheit"""
+        return round(calc.celsius2fahrenheit(value))
@@ -31,6 +31,7 @@ from ..module_info import minfo
 from ._base import Overlay
 
 WIDGET_NAME = "cruise"
+COMPASS_DIRECTIONS = (" N", "NE", " E", "SE", " S", "SW", " W", "NW")
 
 
 class Realtime(Overlay):
@@ -50,6 +51,20 @@ class Realtime(Overlay):
         self.odm_digits = max(int(self.wcfg["odometer_maximum_digits"]), 1)
         self.odm_range = float(self.odm_digits * "9") + 0.9
 
+        # Config units
+        if self.cfg.units["distance_unit"] == "Feet":
+            self.format_elevation = self.format_elevation_feet
+        else:
+            self.format_elevation = self.format_elevation_meter
+
+        if self.cfg.units["odometer_unit"] == "Kilometer":
+            self.format_odometer = self.format_odometer_kilometer
+        elif self.cfg.units["odometer_unit"] == "Mile":
+            self.format_odometer = self.format_odometer_mile
+        else:
+            self.format_odometer = self.format_odometer_meter
+            self.odm_range = int(self.odm_range)
+
         # Base style
         self.setStyleSheet(self.set_qss(
             font_family=self.wcfg["font_name"],
@@ -151,20 +166,23 @@ class Realtime(Overlay):
                 else:
                     time_scale = self.wcfg["track_clock_time_scale"]
 
-                track_time = calc.clock_time(
-                    api.read.session.elapsed(), api.read.session.start(), time_scale)
+                # Compare in whole seconds, same as clock resolution
+                track_time = int(calc.clock_time(
+                    api.read.session.elapsed(), api.read.session.start(), time_scale))
                 self.update_track_clock(track_time, self.last_track_time)
                 self.last_track_time = track_time
 
             # Compass
             if self.wcfg["show_compass"]:
-                orientation = api.read.vehicle.orientation_yaw_radians()
+                # Compare in whole degrees, same as display resolution
+                orientation = round(180 - calc.rad2deg(api.read.vehicle.orientation_yaw_radians()))
                 self.update_compass(orientation, self.last_orientation)
                 self.last_orientation = orientation
 
             # Elevation
             if self.wcfg["show_elevation"]:
-                elevation = api.read.vehicle.position_vertical()
+                # Compare formatted text, raw reading changes every tick
+                elevation = self.format_elevation(api.read.vehicle.position_vertical())
                 self.update_elevation(elevation, self.last_elevation)
                 self.last_elevation = elevation
 
@@ -188,7 +206,7 @@ class Realtime(Overlay):
     def update_elevation(self, curr, last):
         """Elevation"""
         if curr != last:
-            self.bar_elevation.setText(self.format_elevation(curr))
+            self.bar_elevation.setText(curr)
 
     def update_odometer(self, curr, last):
         """Odometer"""
@@ -200,44 +218,35 @@ class Realtime(Overlay):
         """Format clock"""
         return strftime(self.wcfg["track_clock_format"], gmtime(second))
 
-    def format_compass(self, yaw):
+    def format_compass(self, degree):
         """Format compass"""
-        degree = 180 - calc.rad2deg(yaw)
-        return f"{degree:03.0f}°{self.deg2direction(degree)}"
+        return f"{degree:03d}°{self.deg2direction(degree)}"
 
-    def format_elevation(self, meter):
-        """Format elevation"""
-        if self.cfg.units["distance_unit"] == "Feet":
-            return f"↑{calc.meter2feet(meter): >5.0f}ft"
+    @staticmethod
+    def format_elevation_meter(meter):
+        """Format elevation - meter"""
         return f"↑{meter: >4.0f}m"
 
-    def format_odometer(self, meter):
-        """Format odometer"""
-        if self.cfg.units["odometer_unit"] == "Kilometer":
-            distance = min(calc.meter2kilometer(meter), self.odm_range)
-            return f"{distance: >{self.odm_digits + 2}.1f}km"
-        if self.cfg.units["odometer_unit"] == "Mile":
-            distance = min(calc.meter2mile(meter), self.odm_range)
-            return f"{distance: >{self.odm_digits + 2}.1f}mi"
-        return f"{min(meter, int(self.odm_range)): >{self.odm_digits}d}m"
+    @staticmethod
+    def format_elevation_feet(meter):
+        """Format elevation - feet"""
+        return f"↑{calc.meter2feet(meter): >5.0f}ft"
+
+    def format_odometer_meter(self, meter):
+        """Format odometer - meter"""
+        return f"{min(meter, self.odm_range): >{self.odm_digits}d}m"
+
+    def format_odometer_kilometer(self, meter):
+        """Format odometer - kilometer"""
+        distance = min(calc.meter2kilometer(meter), self.odm_range)
+        return f"{distance: >{self.odm_digits + 2}.1f}km"
+
+    def format_odometer_mile(self, meter):
+        """Format odometer - mile"""
+        distance = min(calc.meter2mile(meter), self.odm_range)
+        return f"{distance: >{self.odm_digits + 2}.1f}mi"
 
     @staticmethod
     def deg2direction(degrees):
         """Convert degree to direction"""
-        if degrees <= 22.5 or degrees >= 337.5:
-            text = " N"
-        elif 22.5 < degrees < 67.5:
-            text = "NE"
-        elif 67.5 <= degrees <= 112.5:
-            text = " E"
-        elif 112.5 < degrees < 157.5:
-            text = "SE"
-        elif 157.5 <= degrees <= 202.5:
-            text = " S"
-        elif 202.5 < degrees < 247.5:
-            text = "SW"
-        elif 247.5 <= degrees <= 292.5:
-            text = " W"
-        elif 292.5 < degrees < 337.5:
-            text = "NW"
-        return text
+        return COMPASS_DIRECTIONS[round(degrees / 45) % 8]
@@ -21,7 +21,7 @@ Deltabest Widget
 """
 
 from PySide2.QtCore import Qt, QRectF
-from PySide2.QtGui import QPainter, QPen, QBrush
+from PySide2.QtGui import QPainter, QPen, QBrush, QColor
 
 from .. import calculation as calc
 from ..module_info import minfo
@@ -66,12 +66,16 @@ class Realtime(Overlay):
         else:
             pos_y2 = 0
 
+        self.deltapos_y = pos_y1
         self.rect_deltabar = QRectF(0, pos_y1, self.dbar_length * 2, self.dbar_height)
         self.rect_deltapos = QRectF(0, pos_y1, 0, self.dbar_height)
         self.rect_delta = QRectF(0, pos_y2, self.delta_width, self.delta_height)
         self.rect_text_delta = self.rect_delta.adjusted(0, font_offset, 0, 0)
 
         self.freeze_duration = min(max(self.wcfg["freeze_duration"], 0), 30)
+        self.bar_range = self.wcfg["bar_display_range"]
+        self.bar_scale = self.dbar_length / self.bar_range
+        self.text_range = self.wcfg["delta_display_range"]
 
         # Config canvas
         if self.wcfg["show_delta_bar"]:
@@ -82,10 +86,15 @@ class Realtime(Overlay):
 
         self.pen = QPen()
         self.brush = QBrush(Qt.SolidPattern)
+        self.color_time_gain = QColor(self.wcfg["bkg_color_time_gain"])
+        self.color_time_loss = QColor(self.wcfg["bkg_color_time_loss"])
+        self.color_deltabest = QColor(self.wcfg["bkg_color_deltabest"])
+        self.color_deltabar = QColor(self.wcfg["bkg_color_deltabar"])
 
         # Last data
         self.delta_best = 0
-        self.last_delta_best = 0
+        self.delta_text = self.format_delta(0)
+        self.last_delta_best = None
         self.last_laptime = 0
         self.new_lap = True
 
@@ -99,27 +108,28 @@ class Realtime(Overlay):
                 self.new_lap = True
             else:
                 if self.new_lap:
-                    self.last_laptime = getattr(minfo.delta, f"lapTime{self.wcfg['deltabest_source']}")
+                    self.last_laptime = getattr(
+                        minfo.delta, f"lapTime{self.wcfg['deltabest_source']}")
                     self.new_lap = False
 
                 self.delta_best = getattr(minfo.delta, f"delta{self.wcfg['deltabest_source']}")
 
-            self.update_deltabest(self.delta_best, self.last_delta_best)
-            self.last_delta_best = self.delta_best
+            # Compare in milliseconds, same as display resolution
+            delta_best_ms = round(self.delta_best * 1000)
+            self.update_deltabest(delta_best_ms, self.last_delta_best)
+            self.last_delta_best = delta_best_ms
 
     # GUI update methods
     def update_deltabest(self, curr, last):
         """Deltabest update"""
         if curr != last:
+            self.delta_text = self.format_delta(self.delta_best)
             self.update()
 
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
-        delta_pos = self.delta_position(
-            self.wcfg["bar_display_range"],
-            self.delta_best,
-            self.dbar_length)
+        delta_pos = self.delta_position(self.delta_best)
         # Draw deltabar
         if self.wcfg["show_delta_bar"]:
             self.draw_deltabar(painter, delta_pos)
@@ -135,11 +145,10 @@ class Realtime(Overlay):
             pos_x = self.dbar_length
             width = delta_pos - self.dbar_length
 
-        self.rect_deltapos.moveLeft(pos_x)
-        self.rect_deltapos.setWidth(width)
+        self.rect_deltapos.setRect(pos_x, self.deltapos_y, width, self.dbar_height)
 
         painter.setPen(Qt.NoPen)
-        self.brush.setColor(self.wcfg["bkg_color_deltabar"])
+        self.brush.setColor(self.color_deltabar)
         painter.setBrush(self.brush)
         painter.drawRect(self.rect_deltabar)
 
@@ -150,11 +159,11 @@ class Realtime(Overlay):
     def draw_readings(self, painter, delta_pos):
         """Draw readings"""
         if self.wcfg["swap_style"]:
-            self.pen.setColor(self.wcfg["bkg_color_deltabest"])
+            self.pen.setColor(self.color_deltabest)
             self.brush.setColor(self.color_delta(self.delta_best))
         else:
             self.pen.setColor(self.color_delta(self.delta_best))
-            self.brush.setColor(self.wcfg["bkg_color_deltabest"])
+            self.brush.setColor(self.color_deltabest)
 
         if self.wcfg["show_delta_bar"] and self.wcfg["show_animated_deltabest"]:
             pos_x = min(max(delta_pos - self.delta_width * 0.5, 0),
@@ -173,20 +182,23 @@ class Realtime(Overlay):
 
         painter.setFont(self.font)
         painter.setPen(self.pen)
-        painter.drawText(
-            self.rect_text_delta,
-            Qt.AlignCenter,
-            f"{calc.sym_range(self.delta_best, self.wcfg['delta_display_range']):+.3f}"[:7]
-        )
+        painter.drawText(self.rect_text_delta, Qt.AlignCenter, self.delta_text)
 
     # Additional methods
-    @staticmethod
-    def delta_position(rng, delta, length):
-        """Delta position"""
-        return (rng - calc.sym_range(delta, rng)) * length / rng
+    def delta_position(self, delta):
+        """Delta position, inline symmetric range limit"""
+        if delta > self.bar_range:
+            delta = self.bar_range
+        elif delta < -self.bar_range:
+            delta = -self.bar_range
+        return (self.bar_range - delta) * self.bar_scale
+
+    def format_delta(self, delta):
+        """Format delta text"""
+        return f"{calc.sym_range(delta, self.text_range):+.3f}"[:7]
 
     def color_delta(self, delta):
         """Delta time color"""
         if delta <= 0:
-            return self.wcfg["bkg_color_time_gain"]
-        return self.wcfg["bkg_color_time_loss"]
+            return self.color_time_gain
+        return self.color_time_loss
@@ -21,7 +21,7 @@ DRS Widget
 """
 
 from PySide2.QtCore import Qt, QRectF
-from PySide2.QtGui import QPainter, QPen, QBrush
+from PySide2.QtGui import QPainter, QPen, QBrush, QColor
 
 from ..api_control import api
 from ._base import Overlay
@@ -62,25 +62,39 @@ class Realtime(Overlay):
         self.rect_drs = QRectF(0, 0, self.drs_width, self.drs_height)
         self.rect_text_drs = self.rect_drs.adjusted(0, font_offset, 0, 0)
 
+        # Config state color: (activated, status): (fg, bg)
+        color_available = (
+            QColor(self.wcfg["font_color_available"]),
+            QColor(self.wcfg["bkg_color_available"]))
+        color_activated = (
+            QColor(self.wcfg["font_color_activated"]),
+            QColor(self.wcfg["bkg_color_activated"]))
+        color_allowed = (
+            QColor(self.wcfg["font_color_allowed"]),
+            QColor(self.wcfg["bkg_color_allowed"]))
+        self.color_not_available = (
+            QColor(self.wcfg["font_color_not_available"]),
+            QColor(self.wcfg["bkg_color_not_available"]))
+        self.color_state = {
+            (False, 1): color_available,  # blue
+            (True, 1): color_available,
+            (True, 2): color_activated,  # green
+            (False, 2): color_allowed,  # orange
+        }
+
         # Last data
-        self.drs_state = (0, 0)
-        self.last_drs_state = None
+        self.drs_state = (False, 0)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
 
-            # DRS update
-            self.drs_state = (api.read.switch.drs(),
-                              api.read.switch.drs_status())
-            self.update_drs(self.drs_state, self.last_drs_state)
-            self.last_drs_state = self.drs_state
-
-    # GUI update methods
-    def update_drs(self, curr, last):
-        """DRS update"""
-        if curr != last:
-            self.update()
+            # DRS update, compare fields before creating new state
+            drs_active = api.read.switch.drs() > 0
+            drs_status = api.read.switch.drs_status()
+            if drs_active != self.drs_state[0] or drs_status != self.drs_state[1]:
+                self.drs_state = (drs_active, drs_status)
+                self.update()
 
     def paintEvent(self, event):
         """Draw"""
@@ -110,17 +124,4 @@ class Realtime(Overlay):
     # Additional methods
     def color_drs(self, drs_state):
         """DRS state color"""
-        if drs_state[1] == 1:  # blue
-            color = (self.wcfg["font_color_available"],
-                     self.wcfg["bkg_color_available"])
-        elif drs_state[1] == 2:
-            if drs_state[0]:  # green
-                color = (self.wcfg["font_color_activated"],
-                         self.wcfg["bkg_color_activated"])
-            else:  # orange
-                color = (self.wcfg["font_color_allowed"],
-                         self.wcfg["bkg_color_allowed"])
-        else:  # grey
-            color = (self.wcfg["font_color_not_available"],
-                     self.wcfg["bkg_color_not_available"])
-        return color
+        return self.color_state.get(drs_state, self.color_not_available)  # grey
@@ -27,6 +27,8 @@ from ..module_info import minfo
 from ._base import Overlay
 
 WIDGET_NAME = "force"
+GFORCE_LGT_SYMBOLS = ("▲", "●", "▼")
+GFORCE_LAT_SYMBOLS = ("▶", "●", "◀")
 
 
 class Realtime(Overlay):
@@ -62,13 +64,13 @@ class Realtime(Overlay):
 
         # G force
         if self.wcfg["show_g_force"]:
-            bar_style_gforce_lgt = self.set_qss(
+            bar_style_gforce = self.set_qss(
                 fg_color=self.wcfg["font_color_g_force"],
                 bg_color=self.wcfg["bkg_color_g_force"]
             )
             self.bar_gforce_lgt = self.set_qlabel(
                 text=text_def,
-                style=bar_style_gforce_lgt,
+                style=bar_style_gforce,
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -76,13 +78,9 @@ class Realtime(Overlay):
                 column=self.wcfg["column_index_long_gforce"],
             )
 
-            bar_style_gforce_lat = self.set_qss(
-                fg_color=self.wcfg["font_color_g_force"],
-                bg_color=self.wcfg["bkg_color_g_force"]
-            )
             self.bar_gforce_lat = self.set_qlabel(
                 text=text_def,
-                style=bar_style_gforce_lat,
+                style=bar_style_gforce,
                 width=bar_width,
             )
             self.set_primary_orient(
@@ -152,38 +150,41 @@ class Realtime(Overlay):
         self.last_df_ratio = None
         self.last_df_front = None
         self.last_df_rear = None
+        self.last_lift_front = False
+        self.last_lift_rear = False
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
+            force = minfo.force
 
             # G force
             if self.wcfg["show_g_force"]:
-                # Longitudinal g-force
-                gf_lgt = round(minfo.force.lgtGForceRaw, 2)
+                # Longitudinal g-force (0.01g)
+                gf_lgt = round(force.lgtGForceRaw * 100)
                 self.update_gf_lgt(gf_lgt, self.last_gf_lgt)
                 self.last_gf_lgt = gf_lgt
 
-                # Lateral g-force
-                gf_lat = round(minfo.force.latGForceRaw, 2)
+                # Lateral g-force (0.01g)
+                gf_lat = round(force.latGForceRaw * 100)
                 self.update_gf_lat(gf_lat, self.last_gf_lat)
                 self.last_gf_lat = gf_lat
 
             # Downforce ratio
             if self.wcfg["show_downforce_ratio"]:
-                df_ratio = round(minfo.force.downForceRatio, 2)
+                df_ratio = round(force.downForceRatio, 2)
                 self.update_df_ratio(df_ratio, self.last_df_ratio)
                 self.last_df_ratio = df_ratio
 
             # Front downforce
             if self.wcfg["show_front_downforce"]:
-                df_front = round(minfo.force.downForceFront)
+                df_front = round(force.downForceFront)
                 self.update_df_front(df_front, self.last_df_front)
                 self.last_df_front = df_front
 
             # Rear downforce
             if self.wcfg["show_rear_downforce"]:
-                df_rear = round(minfo.force.downForceRear)
+                df_rear = round(force.downForceRear)
                 self.update_df_rear(df_rear, self.last_df_rear)
                 self.last_df_rear = df_rear
 
@@ -191,12 +192,12 @@ class Realtime(Overlay):
     def update_gf_lgt(self, curr, last):
         """Longitudinal g-force"""
         if curr != last:
-            self.bar_gforce_lgt.setText(f"{self.gforce_lgt(curr)} {abs(curr):.2f}")
+            self.bar_gforce_lgt.setText(f"{self.gforce_lgt(curr)} {abs(curr) / 100:.2f}")
 
     def update_gf_lat(self, curr, last):
         """Lateral g-force"""
         if curr != last:
-            self.bar_gforce_lat.setText(f"{abs(curr):.2f} {self.gforce_lat(curr)}")
+            self.bar_gforce_lat.setText(f"{abs(curr) / 100:.2f} {self.gforce_lat(curr)}")
 
     def update_df_ratio(self, curr, last):
         """Downforce ratio"""
@@ -207,30 +208,28 @@ class Realtime(Overlay):
     def update_df_front(self, curr, last):
         """Downforce front"""
         if curr != last:
-            self.bar_df_front.setText(f"F{abs(curr):5.0f}"[:6])
-            self.bar_df_front.setStyleSheet(self.bar_style_df_front[curr < 0])
+            self.bar_df_front.setText(f"F{min(abs(curr), 99999):5d}")
+            is_lift = curr < 0
+            if self.last_lift_front != is_lift:
+                self.last_lift_front = is_lift
+                self.bar_df_front.setStyleSheet(self.bar_style_df_front[is_lift])
 
     def update_df_rear(self, curr, last):
         """Downforce rear"""
         if curr != last:
-            self.bar_df_rear.setText(f"R{abs(curr):5.0f}"[:6])
-            self.bar_df_rear.setStyleSheet(self.bar_style_df_rear[curr < 0])
+            self.bar_df_rear.setText(f"R{min(abs(curr), 99999):5d}")
+            is_lift = curr < 0
+            if self.last_lift_rear != is_lift:
+                self.last_lift_rear = is_lift
+                self.bar_df_rear.setStyleSheet(self.bar_style_df_rear[is_lift])
 
     # Additional methods
     @staticmethod
     def gforce_lgt(g_force):
-        """Longitudinal g-force direction symbol"""
-        if g_force > 0.1:
-            return "▼"
-        if g_force < -0.1:
-            return "▲"
-        return "●"
+        """Longitudinal g-force direction symbol, g-force in 0.01g"""
+        return GFORCE_LGT_SYMBOLS[(g_force > 10) - (g_force < -10) + 1]
 
     @staticmethod
     def gforce_lat(g_force):
-        """Lateral g-force direction symbol"""
-        if g_force > 0.1:
-            return "◀"
-        if g_force < -0.1:
-            return "▶"
-        return "●"
+        """Lateral g-force direction symbol, g-force in 0.01g"""
+        return GFORCE_LAT_SYMBOLS[(g_force > 10) - (g_force < -10) + 1]
@@ -47,6 +47,7 @@ class Realtime(Overlay):
         # Config variable
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         bar_gap = self.wcfg["bar_gap"]
+        self.is_gallon = self.cfg.units["fuel_unit"] == "Gallon"
 
         # Base style
         self.setStyleSheet(self.set_qss(
@@ -57,7 +58,6 @@ class Realtime(Overlay):
 
         # Max display laps
         self.laps_count = max(self.wcfg["lap_time_history_count"], 1)
-        self.data_bar = {}
 
         # Create layout
         layout = QGridLayout()
@@ -76,8 +76,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_last_laps"],
                 bg_color=self.wcfg["bkg_color_last_laps"])
         )
-        self.set_table(
-            name="laps",
+        self.bar_laps = self.set_table(
             text="---",
             style=bar_style_laps,
             width=font_m.width * 3 + bar_padx,
@@ -96,8 +95,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_invalid_laptime"],
                 bg_color=self.wcfg["bkg_color_last_time"])
         )
-        self.set_table(
-            name="time",
+        self.bar_time = self.set_table(
             text="-:--.---",
             style=self.bar_style_time,
             width=font_m.width * 8 + bar_padx,
@@ -113,8 +111,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_last_fuel"],
                 bg_color=self.wcfg["bkg_color_last_fuel"])
         )
-        self.set_table(
-            name="fuel",
+        self.bar_fuel = self.set_table(
             text="-.--",
             style=bar_style_fuel,
             width=font_m.width * 4 + bar_padx,
@@ -130,8 +127,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_last_wear"],
                 bg_color=self.wcfg["bkg_color_last_wear"])
         )
-        self.set_table(
-            name="wear",
+        self.bar_wear = self.set_table(
             text="---",
             style=bar_style_wear,
             width=font_m.width * 3 + bar_padx,
@@ -146,34 +142,33 @@ class Realtime(Overlay):
         )
         self.last_wear = 0
         self.last_lap_stime = 0  # last lap start time
-        self.last_laps_text = None
-        self.last_time_text = None
-        self.last_fuel_text = None
-        self.last_wear_text = None
+        self.last_valid_history = [None] * (self.laps_count + 1)
+        self.last_lap_num = None
+        self.last_lap_time = None
+        self.last_fuel_used = None
+        self.last_wear_used = None
 
     # GUI generate methods
-    def set_table(self, name: str, text: str, style: str, width: int, column: int):
+    def set_table(self, text: str, style: tuple, width: int, column: int):
         """Set table"""
-        for idx in range(self.laps_count + 1):
-            if idx == 0:
-                style_idx = 0
-            else:
-                style_idx = 1
-            bar_name = f"{idx}_{name}"
-            self.data_bar[bar_name] = self.set_qlabel(
+        bar_set = tuple(
+            self.set_qlabel(
                 text=text,
-                style=style[style_idx],
+                style=style[idx > 0],
                 width=width,
             )
+            for idx in range(self.laps_count + 1)
+        )
+        for idx, target_bar in enumerate(bar_set):
             if not self.wcfg["show_empty_history"] and idx > 0:
-                self.data_bar[bar_name].hide()
+                target_bar.hide()
             # Set layout
             if self.wcfg["layout"] == 0:
                 row_index = idx
             else:
                 row_index = self.laps_count - idx + 1
-            self.layout().addWidget(
-                self.data_bar[bar_name], row_index, column)
+            self.layout().addWidget(target_bar, row_index, column)
+        return bar_set
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
@@ -181,14 +176,15 @@ class Realtime(Overlay):
 
             # Read laps data
             lap_stime = api.read.timing.start()
-            wear_avg = 100 - (sum(api.read.tyre.wear()) * 25)
+            wear = api.read.tyre.wear()
+            wear_avg = 100 - (wear[0] + wear[1] + wear[2] + wear[3]) * 25
 
             # Check if virtual energy available
-            if self.wcfg["show_virtual_energy_if_available"] and minfo.restapi.maxVirtualEnergy:
-                temp_fuel_last = minfo.energy.lastLapConsumption
+            is_energy = (self.wcfg["show_virtual_energy_if_available"]
+                         and minfo.restapi.maxVirtualEnergy)
+            if is_energy:
                 temp_fuel_est = minfo.energy.estimatedConsumption
             else:
-                temp_fuel_last = self.fuel_units(minfo.fuel.lastLapConsumption)
                 temp_fuel_est = self.fuel_units(minfo.fuel.estimatedConsumption)
 
             if lap_stime != self.last_lap_stime:  # time stamp difference
@@ -197,12 +193,19 @@ class Realtime(Overlay):
                     self.last_lap_stime = lap_stime  # reset time stamp counter
                     self.laps_data[1] = minfo.delta.lapTimeLast
                     self.laps_data[2] = minfo.delta.isValidLap
-                    self.laps_data[3] = temp_fuel_last
+                    if is_energy:
+                        self.laps_data[3] = minfo.energy.lastLapConsumption
+                    else:
+                        self.laps_data[3] = self.fuel_units(minfo.fuel.lastLapConsumption)
                     # Update lap time history while on track
                     if not api.read.vehicle.in_garage():
+                        last_history_data = tuple(self.history_data)
                         self.history_data.appendleft(self.laps_data[:])
+                        self.setUpdatesEnabled(False)
                         for index in range(self.laps_count):
-                            self.update_laps_history(self.history_data[index], index + 1)
+                            self.update_laps_history(
+                                self.history_data[index], last_history_data[index], index + 1)
+                        self.setUpdatesEnabled(True)
 
             # Current laps data
             self.laps_data[0] = api.read.lap.number()
@@ -210,51 +213,70 @@ class Realtime(Overlay):
             self.laps_data[3] = temp_fuel_est
             self.laps_data[4] = max(wear_avg - self.last_wear, 0)
 
-            laps_text = f"{self.laps_data[0]:03.0f}"[:3]
-            self.update_laps(self.data_bar["0_laps"], laps_text, self.last_laps_text)
-            self.last_laps_text = laps_text
+            lap_num = self.laps_data[0]
+            self.update_lap_num(lap_num, self.last_lap_num)
+            self.last_lap_num = lap_num
 
-            time_text = calc.sec2laptime_full(self.laps_data[1])[:8]
-            self.update_laps(self.data_bar["0_time"], time_text, self.last_time_text)
-            self.last_time_text = time_text
+            lap_time = round(self.laps_data[1], 3)
+            self.update_lap_time(lap_time, self.last_lap_time)
+            self.last_lap_time = lap_time
 
-            fuel_text = f"{self.laps_data[3]:04.2f}"[:4]
-            self.update_laps(self.data_bar["0_fuel"], fuel_text, self.last_fuel_text)
-            self.last_fuel_text = fuel_text
+            fuel_used = round(self.laps_data[3], 2)
+            self.update_fuel_used(fuel_used, self.last_fuel_used)
+            self.last_fuel_used = fuel_used
 
-            wear_text = f"{self.laps_data[4]:03.1f}"[:3]
-            self.update_laps(self.data_bar["0_wear"], wear_text, self.last_wear_text)
-            self.last_wear_text = wear_text
+            wear_used = round(self.laps_data[4], 1)
+            self.update_wear_used(wear_used, self.last_wear_used)
+            self.last_wear_used = wear_used
 
     # GUI update methods
-    def update_laps(self, target_bar, curr, last):
-        """Laps data"""
+    def update_lap_num(self, curr, last):
+        """Lap number"""
+        if curr != last:
+            self.bar_laps[0].setText(f"{curr:03.0f}"[:3])
+
+    def update_lap_time(self, curr, last):
+        """Estimated lap time"""
+        if curr != last:
+            self.bar_time[0].setText(calc.sec2laptime_full(curr)[:8])
+
+    def update_fuel_used(self, curr, last):
+        """Estimated fuel consumption"""
+        if curr != last:
+            self.bar_fuel[0].setText(f"{curr:04.2f}"[:4])
+
+    def update_wear_used(self, curr, last):
+        """Tyre wear"""
         if curr != last:
-            target_bar.setText(curr)
+            self.bar_wear[0].setText(f"{curr:03.1f}"[:3])
 
-    def update_laps_history(self, curr, index):
+    def update_laps_history(self, curr, last, index):
         """Laps history data"""
+        if curr == last:
+            return
         if curr[1]:
-            self.data_bar[f"{index}_laps"].setText(f"{max(curr[0] - 1, 0):03.0f}"[:3])
-            self.data_bar[f"{index}_time"].setText(calc.sec2laptime_full(curr[1])[:8])
+            self.bar_laps[index].setText(f"{max(curr[0] - 1, 0):03.0f}"[:3])
+            self.bar_time[index].setText(calc.sec2laptime_full(curr[1])[:8])
             # Mark invalid lap time
-            self.data_bar[f"{index}_time"].setStyleSheet(self.bar_style_time[2 - curr[2]])
-            self.data_bar[f"{index}_fuel"].setText(f"{curr[3]:04.2f}"[:4])
-            self.data_bar[f"{index}_wear"].setText(f"{curr[4]:03.1f}"[:3])
-            self.data_bar[f"{index}_laps"].show()
-            self.data_bar[f"{index}_time"].show()
-            self.data_bar[f"{index}_fuel"].show()
-            self.data_bar[f"{index}_wear"].show()
+            if self.last_valid_history[index] != curr[2]:
+                self.last_valid_history[index] = curr[2]
+                self.bar_time[index].setStyleSheet(self.bar_style_time[2 - curr[2]])
+            self.bar_fuel[index].setText(f"{curr[3]:04.2f}"[:4])
+            self.bar_wear[index].setText(f"{curr[4]:03.1f}"[:3])
+            self.bar_laps[index].show()
+            self.bar_time[index].show()
+            self.bar_fuel[index].show()
+            self.bar_wear[index].show()
 
         elif not self.wcfg["show_empty_history"]:
-            self.data_bar[f"{index}_laps"].hide()
-            self.data_bar[f"{index}_time"].hide()
-            self.data_bar[f"{index}_fuel"].hide()
-            self.data_bar[f"{index}_wear"].hide()
+            self.bar_laps[index].hide()
+            self.bar_time[index].hide()
+            self.bar_fuel[index].hide()
+            self.bar_wear[index].hide()
 
     # Additional methods
     def fuel_units(self, fuel):
         """2 different fuel unit conversion, default is Liter"""
-        if self.cfg.units["fuel_unit"] == "Gallon":
+        if self.is_gallon:
             return calc.liter2gallon(fuel)
         return fuel
@@ -100,31 +100,35 @@ class Realtime(Overlay):
             layout.addWidget(self.bar_timer, 0, self.wcfg["column_index_activation_timer"])
 
         # Last data
-        self.last_battery_charge = None
-        self.last_active_timer = None
+        self.last_battery_charge = None, None
+        self.last_active_timer = None, None
+        self.last_timer_cooldown = False
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
+            hybrid = minfo.hybrid
 
             # Battery charge
             if self.wcfg["show_battery_charge"]:
-                state = minfo.hybrid.motorState
+                state = hybrid.motorState
                 if state == 1:  # cooldown check
                     state = (
                         api.read.engine.gear() >= self.wcfg["activation_threshold_gear"] and
                         api.read.vehicle.speed() * 3.6 > self.wcfg["activation_threshold_speed"] and
-                        api.read.input.throttle_raw() >= self.wcfg["activation_threshold_throttle"] and
-                        minfo.hybrid.motorInactiveTimer >= self.wcfg["minimum_activation_time_delay"] and
-                        minfo.hybrid.motorActiveTimer < self.wcfg["maximum_activation_time_per_lap"] - 0.05
+                        (api.read.input.throttle_raw()
+                         >= self.wcfg["activation_threshold_throttle"]) and
+                        hybrid.motorInactiveTimer >= self.wcfg["minimum_activation_time_delay"] and
+                        (hybrid.motorActiveTimer
+                         < self.wcfg["maximum_activation_time_per_lap"] - 0.05)
                     )
-                battery_charge = minfo.hybrid.batteryCharge, state
+                battery_charge = round(hybrid.batteryCharge), state
                 self.update_battery_charge(battery_charge, self.last_battery_charge)
                 self.last_battery_charge = battery_charge
 
             # Activation timer
             if self.wcfg["show_activation_timer"]:
-                active_timer = minfo.hybrid.motorActiveTimer, minfo.hybrid.motorState
+                active_timer = round(hybrid.motorActiveTimer, 2), hybrid.motorState
                 self.update_active_timer(active_timer, self.last_active_timer)
                 self.last_active_timer = active_timer
 
@@ -132,16 +136,21 @@ class Realtime(Overlay):
     def update_battery_charge(self, curr, last):
         """Battery charge"""
         if curr != last:
-            if curr[0] < 99.5:
-                format_text = f"±{curr[0]:02.0f}"
-            else:
-                format_text = "MAX"
-
-            self.bar_charge.setText(format_text)
-            self.bar_charge.setStyleSheet(self.bar_style_charge[curr[1]])
+            if curr[0] != last[0]:
+                if curr[0] < 100:
+                    format_text = f"±{curr[0]:02d}"
+                else:
+                    format_text = "MAX"
+                self.bar_charge.setText(format_text)
+            if curr[1] != last[1]:
+                self.bar_charge.setStyleSheet(self.bar_style_charge[curr[1]])
 
     def update_active_timer(self, curr, last):
         """P2P activation timer"""
         if curr != last:
-            self.bar_timer.setText(f"{curr[0]:.2f}"[:4])
-            self.bar_timer.setStyleSheet(self.bar_style_timer[curr[1] != 2])
+            if curr[0] != last[0]:
+                self.bar_timer.setText(f"{curr[0]:.2f}"[:4])
+            is_cooldown = curr[1] != 2
+            if self.last_timer_cooldown != is_cooldown:
+                self.last_timer_cooldown = is_cooldown
+                self.bar_timer.setStyleSheet(self.bar_style_timer[is_cooldown])
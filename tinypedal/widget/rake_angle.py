@@ -20,6 +20,8 @@
 Rake angle Widget
 """
 
+from functools import lru_cache
+
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
@@ -30,6 +32,12 @@ from ._base import Overlay
 WIDGET_NAME = "rake_angle"
 
 
+@lru_cache(maxsize=256)
+def format_rake_angle(rake: int, wheelbase: float) -> str:
+    """Format rake angle text from rake (0.01 millimeters)"""
+    return f"{calc.rake2angle(rake / 100, wheelbase):+.2f}"[:5]
+
+
 class Realtime(Overlay):
     """Draw widget"""
 
@@ -45,7 +53,9 @@ class Realtime(Overlay):
         bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
         self.prefix_text = self.wcfg["prefix_rake_angle"]
         self.sign_text = "°" if self.wcfg["show_degree_sign"] else ""
-        ride_diff = "(00)" if self.wcfg["show_ride_height_difference"] else ""
+        self.wheelbase = self.wcfg["wheelbase"]
+        self.show_ride_diff = self.wcfg["show_ride_height_difference"]
+        ride_diff = "(00)" if self.show_ride_diff else ""
         text_def = f"{self.prefix_text}+0.00{self.sign_text}{ride_diff}"
 
         # Base style
@@ -79,26 +89,38 @@ class Realtime(Overlay):
         layout.addWidget(self.bar_rake, 0, 0)
 
         # Last data
+        self.last_ride_height = None
         self.last_rake = 0
+        self.last_rake_text = None
+        self.last_negative = False
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
 
             # Rake angle
-            rake = round(calc.rake(*api.read.wheel.ride_height()), 2)
-            self.update_rakeangle(rake, self.last_rake)
-            self.last_rake = rake
+            ride_height = api.read.wheel.ride_height()
+            if self.last_ride_height != ride_height:
+                self.last_ride_height = ride_height
+                rake = round(calc.rake(*ride_height) * 100)  # 0.01mm
+                self.update_rakeangle(rake, self.last_rake)
+                self.last_rake = rake
 
     # GUI update methods
     def update_rakeangle(self, curr, last):
         """Rake angle data"""
         if curr != last:
-            rake_angle = f"{calc.rake2angle(curr, self.wcfg['wheelbase']):+.2f}"[:5]
-            if self.wcfg["show_ride_height_difference"]:
-                ride_diff = f"({abs(curr):02.0f})"[:4]
+            rake_angle = format_rake_angle(curr, self.wheelbase)
+            if self.show_ride_diff:
+                ride_diff = f"({abs(curr) / 100:02.0f})"[:4]
             else:
                 ride_diff = ""
 
-            self.bar_rake.setText(f"{self.prefix_text}{rake_angle}{self.sign_text}{ride_diff}")
-            self.bar_rake.setStyleSheet(self.bar_style_rake[curr < 0])
+            rake_text = f"{self.prefix_text}{rake_angle}{self.sign_text}{ride_diff}"
+            if self.last_rake_text != rake_text:
+                self.last_rake_text = rake_text
+                self.bar_rake.setText(rake_text)
+            is_negative = curr < 0
+            if self.last_negative != is_negative:
+                self.last_negative = is_negative
+                self.bar_rake.setStyleSheet(self.bar_style_rake[is_negative])
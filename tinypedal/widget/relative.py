@@ -54,6 +54,8 @@ class Realtime(Overlay):
         self.cls_width = max(int(self.wcfg["class_width"]), 1)
         self.gap_width = max(int(self.wcfg["time_gap_width"]), 1)
         self.gap_decimals = max(int(self.wcfg["time_gap_decimal_places"]), 0)
+        self.show_player_highlighted = self.wcfg["show_player_highlighted"]
+        self.show_pit_request = self.wcfg["show_pit_request"]
         self.tyre_compound_string = self.cfg.units["tyre_compound_symbol"].ljust(20, "?")
 
         # Base style
@@ -82,9 +84,11 @@ class Realtime(Overlay):
             (-1,0,0)  # pit_count
         )
         self.pixmap_brandlogo = {"blank": QPixmap()}
-        self.data_bar = {}
-        self.curr_data = [None] * self.veh_range
-        self.last_data = [tuple(None for _ in self.empty_vehicles_data)] * self.veh_range
+        self.driver_name_text = {}
+        self.vehicle_name_text = {}
+        self.last_data = [tuple(
+            (None,) * len(data) if isinstance(data, tuple) else None
+            for data in self.empty_vehicles_data)] * self.veh_range
 
         # Create layout
         layout = QGridLayout()
@@ -96,37 +100,25 @@ class Realtime(Overlay):
 
         # Driver position
         if self.wcfg["show_position"]:
-            bar_style_pos = self.set_qss(
-                fg_color=self.wcfg["font_color_position"],
-                bg_color=self.wcfg["bkg_color_position"]
-            )
-            self.set_table(
-                name="pos",
-                style=bar_style_pos,
+            self.bar_style_pos = self.set_lap_diff_style("position")
+            self.bar_pos = self.set_table(
+                style=self.bar_style_pos[0],
                 width=2 * font_m.width + bar_padx,
                 column=self.wcfg["column_index_position"],
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
-            bar_style_drv = self.set_qss(
-                fg_color=self.wcfg["font_color_driver_name"],
-                bg_color=self.wcfg["bkg_color_driver_name"]
-            )
-            self.set_table(
-                name="drv",
-                style=bar_style_drv,
+            self.bar_style_drv = self.set_lap_diff_style("driver_name")
+            self.bar_drv = self.set_table(
+                style=self.bar_style_drv[0],
                 width=self.drv_width * font_m.width + bar_padx,
                 column=self.wcfg["column_index_driver"],
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
-            bar_style_veh = self.set_qss(
-                fg_color=self.wcfg["font_color_vehicle_name"],
-                bg_color=self.wcfg["bkg_color_vehicle_name"]
-            )
-            self.set_table(
-                name="veh",
-                style=bar_style_veh,
+            self.bar_style_veh = self.set_lap_diff_style("vehicle_name")
+            self.bar_veh = self.set_table(
+                style=self.bar_style_veh[0],
                 width=self.veh_width * font_m.width + bar_padx,
                 column=self.wcfg["column_index_vehicle"],
             )
@@ -138,21 +130,16 @@ class Realtime(Overlay):
                 self.set_qss(
                     bg_color=self.wcfg["bkg_color_player_brand_logo"])
             )
-            self.set_table(
-                name="brd",
+            self.bar_brd = self.set_table(
                 style=self.bar_style_brd[0],
                 width=self.brd_width,
                 column=self.wcfg["column_index_brand_logo"],
             )
         # Time gap
         if self.wcfg["show_time_gap"]:
-            bar_style_gap = self.set_qss(
-                fg_color=self.wcfg["font_color_time_gap"],
-                bg_color=self.wcfg["bkg_color_time_gap"]
-            )
-            self.set_table(
-                name="gap",
-                style=bar_style_gap,
+            self.bar_style_gap = self.set_lap_diff_style("time_gap")
+            self.bar_gap = self.set_table(
+                style=self.bar_style_gap[0],
                 width=self.gap_width * font_m.width + bar_padx,
                 column=self.wcfg["column_index_timegap"],
             )
@@ -166,8 +153,7 @@ class Realtime(Overlay):
                     fg_color=self.wcfg["font_color_player_laptime"],
                     bg_color=self.wcfg["bkg_color_player_laptime"])
             )
-            self.set_table(
-                name="lpt",
+            self.bar_lpt = self.set_table(
                 style=self.bar_style_lpt[0],
                 width=8 * font_m.width + bar_padx,
                 column=self.wcfg["column_index_laptime"],
@@ -182,20 +168,19 @@ class Realtime(Overlay):
                     fg_color=self.wcfg["font_color_player_position_in_class"],
                     bg_color=self.wcfg["bkg_color_player_position_in_class"])
             )
-            self.set_table(
-                name="pic",
+            self.bar_pic = self.set_table(
                 style=self.bar_style_pic[0],
                 width=2 * font_m.width + bar_padx,
                 column=self.wcfg["column_index_position_in_class"],
             )
         # Vehicle class
         if self.wcfg["show_class"]:
+            self.class_style = {}
             bar_style_cls = self.set_qss(
                 fg_color=self.wcfg["font_color_class"],
                 bg_color=self.wcfg["bkg_color_class"]
             )
-            self.set_table(
-                name="cls",
+            self.bar_cls = self.set_table(
                 style=bar_style_cls,
                 width=self.cls_width * font_m.width + bar_padx,
                 column=self.wcfg["column_index_class"],
@@ -210,8 +195,7 @@ class Realtime(Overlay):
                     fg_color=self.wcfg["font_color_pit"],
                     bg_color=self.wcfg["bkg_color_pit"])
             )
-            self.set_table(
-                name="pit",
+            self.bar_pit = self.set_table(
                 style=self.bar_style_pit[1],
                 width=len(self.wcfg["pit_status_text"]) * font_m.width + bar_padx,
                 column=self.wcfg["column_index_pitstatus"],
@@ -226,8 +210,7 @@ class Realtime(Overlay):
                     fg_color=self.wcfg["font_color_player_tyre_compound"],
                     bg_color=self.wcfg["bkg_color_player_tyre_compound"])
             )
-            self.set_table(
-                name="tcp",
+            self.bar_tcp = self.set_table(
                 style=self.bar_style_tcp[0],
                 width=2 * font_m.width + bar_padx,
                 column=self.wcfg["column_index_tyre_compound"],
@@ -245,8 +228,7 @@ class Realtime(Overlay):
                     fg_color=self.wcfg["font_color_pit_request"],
                     bg_color=self.wcfg["bkg_color_pit_request"])
             )
-            self.set_table(
-                name="psc",
+            self.bar_psc = self.set_table(
                 style=self.bar_style_psc[0],
                 width=2 * font_m.width + bar_padx,
                 column=self.wcfg["column_index_pitstop_count"],
@@ -257,6 +239,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             relative_list = minfo.relative.relative
+            veh_info = minfo.vehicles.dataSet
             total_idx = len(relative_list)
             total_veh_idx = api.read.vehicle.total_vehicles()
 
@@ -265,226 +248,174 @@ class Realtime(Overlay):
 
                 # Get vehicle data
                 if idx < total_idx and 0 <= relative_list[idx] < total_veh_idx:
-                    self.curr_data[idx] = self.get_data(
-                        relative_list[idx], minfo.vehicles.dataSet)
-                elif self.last_data[idx] == self.empty_vehicles_data:
+                    curr_data = self.get_data(relative_list[idx], veh_info)
+                elif self.last_data[idx] is self.empty_vehicles_data:
                     continue  # skip if already empty
                 else:
-                    self.curr_data[idx] = self.empty_vehicles_data
+                    curr_data = self.empty_vehicles_data
+                last_data = self.last_data[idx]
+                if curr_data == last_data:
+                    continue  # skip if unchanged
+
                 # Driver position
                 if self.wcfg["show_position"]:
-                    self.update_pos(self.data_bar[f"{idx}_pos"],
-                                    self.curr_data[idx][1],
-                                    self.last_data[idx][1],
-                                    )
+                    self.update_pos(self.bar_pos[idx], curr_data[1], last_data[1])
                 # Driver name
                 if self.wcfg["show_driver_name"]:
-                    self.update_drv(self.data_bar[f"{idx}_drv"],
-                                    self.curr_data[idx][2],
-                                    self.last_data[idx][2],
-                                    )
+                    self.update_drv(self.bar_drv[idx], curr_data[2], last_data[2])
                 # Vehicle name
                 if self.wcfg["show_vehicle_name"]:
-                    self.update_veh(self.data_bar[f"{idx}_veh"],
-                                    self.curr_data[idx][3],
-                                    self.last_data[idx][3],
-                                    )
+                    self.update_veh(self.bar_veh[idx], curr_data[3], last_data[3])
                 # Brand logo
                 if self.wcfg["show_brand_logo"]:
-                    self.update_brd(self.data_bar[f"{idx}_brd"],
-                                    self.curr_data[idx][3],
-                                    self.last_data[idx][3],
-                                    )
+                    self.update_brd(self.bar_brd[idx], curr_data[3], last_data[3])
                 # Time gap
                 if self.wcfg["show_time_gap"]:
-                    self.update_gap(self.data_bar[f"{idx}_gap"],
-                                    self.curr_data[idx][6],
-                                    self.last_data[idx][6],
-                                    )
+                    self.update_gap(self.bar_gap[idx], curr_data[6], last_data[6])
                 # Vehicle laptime
                 if self.wcfg["show_laptime"]:
-                    self.update_lpt(self.data_bar[f"{idx}_lpt"],
-                                    self.curr_data[idx][8],
-                                    self.last_data[idx][8],
-                                    )
+                    self.update_lpt(self.bar_lpt[idx], curr_data[8], last_data[8])
                 # Position in class
                 if self.wcfg["show_position_in_class"]:
-                    self.update_pic(self.data_bar[f"{idx}_pic"],
-                                    self.curr_data[idx][4],
-                                    self.last_data[idx][4],
-                                    )
+                    self.update_pic(self.bar_pic[idx], curr_data[4], last_data[4])
                 # Vehicle class
                 if self.wcfg["show_class"]:
-                    self.update_cls(self.data_bar[f"{idx}_cls"],
-                                    self.curr_data[idx][5],
-                                    self.last_data[idx][5]
-                                    )
+                    self.update_cls(self.bar_cls[idx], curr_data[5], last_data[5])
                 # Vehicle in pit
                 if self.wcfg["show_pit_status"]:
-                    self.update_pit(self.data_bar[f"{idx}_pit"],
-                                    self.curr_data[idx][0],
-                                    self.last_data[idx][0]
-                                    )
+                    self.update_pit(self.bar_pit[idx], curr_data[0], last_data[0])
                 # Tyre compound index
                 if self.wcfg["show_tyre_compound"]:
-                    self.update_tcp(self.data_bar[f"{idx}_tcp"],
-                                    self.curr_data[idx][7],
-                                    self.last_data[idx][7],
-                                    )
+                    self.update_tcp(self.bar_tcp[idx], curr_data[7], last_data[7])
                 # Pitstop count
                 if self.wcfg["show_pitstop_count"]:
-                    self.update_psc(self.data_bar[f"{idx}_psc"],
-                                    self.curr_data[idx][9],
-                                    self.last_data[idx][9],
-                                    )
+                    self.update_psc(self.bar_psc[idx], curr_data[9], last_data[9])
                 # Store last data reading
-                self.last_data[idx] = self.curr_data[idx]
+                self.last_data[idx] = curr_data
 
     # GUI update methods
     def update_pos(self, target_bar, curr, last):
         """Driver position"""
         if curr != last:
-            if curr[2]:  # highlight player
-                color = (f"color: {self.wcfg['font_color_player_position']};"
-                         f"background: {self.wcfg['bkg_color_player_position']};")
-            elif self.wcfg["show_lap_difference"]:
-                color = (f"color: {self.color_lap_diff(curr[1])};"
-                         f"background: {self.wcfg['bkg_color_position']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_position']};"
-                         f"background: {self.wcfg['bkg_color_position']};")
-
-            if curr[0] != "":
-                text = f"{curr[0]:02d}"
-            else:
-                text = ""
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(color)
+            if curr[0] != last[0]:
+                if curr[0] != "":
+                    text = f"{curr[0]:02d}"
+                else:
+                    text = ""
+                target_bar.setText(text)
+            if curr[1:] != last[1:]:
+                if curr[2]:  # highlight player
+                    color = self.bar_style_pos[3]
+                elif curr[1] > 0:
+                    color = self.bar_style_pos[1]
+                elif curr[1] < 0:
+                    color = self.bar_style_pos[2]
+                else:
+                    color = self.bar_style_pos[0]
+                target_bar.setStyleSheet(color)
 
     def update_drv(self, target_bar, curr, last):
         """Driver name"""
         if curr != last:
-            if curr[2]:  # highlight player
-                color = (f"color: {self.wcfg['font_color_player_driver_name']};"
-                         f"background: {self.wcfg['bkg_color_player_driver_name']};")
-            elif self.wcfg["show_lap_difference"]:
-                color = (f"color: {self.color_lap_diff(curr[1])};"
-                         f"background: {self.wcfg['bkg_color_driver_name']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_driver_name']};"
-                         f"background: {self.wcfg['bkg_color_driver_name']};")
-
-            if self.wcfg["driver_name_shorten"]:
-                text = fmt.shorten_driver_name(curr[0])
-            else:
-                text = curr[0]
-
-            if self.wcfg["driver_name_uppercase"]:
-                text = text.upper()
-
-            if self.wcfg["driver_name_align_center"]:
-                text = text[:self.drv_width]
-            else:
-                text = text[:self.drv_width].ljust(self.drv_width)
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(color)
+            if curr[0] != last[0]:
+                target_bar.setText(self.format_driver_name(curr[0]))
+            if curr[1:] != last[1:]:
+                if curr[2]:  # highlight player
+                    color = self.bar_style_drv[3]
+                elif curr[1] > 0:
+                    color = self.bar_style_drv[1]
+                elif curr[1] < 0:
+                    color = self.bar_style_drv[2]
+                else:
+                    color = self.bar_style_drv[0]
+                target_bar.setStyleSheet(color)
 
     def update_veh(self, target_bar, curr, last):
         """Vehicle name"""
         if curr != last:
-            if curr[2]:  # highlight player
-                color = (f"color: {self.wcfg['font_color_player_vehicle_name']};"
-                         f"background: {self.wcfg['bkg_color_player_vehicle_name']};")
-            elif self.wcfg["show_lap_difference"]:
-                color = (f"color: {self.color_lap_diff(curr[1])};"
-                         f"background: {self.wcfg['bkg_color_vehicle_name']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_vehicle_name']};"
-                         f"background: {self.wcfg['bkg_color_vehicle_name']};")
-
-            if self.wcfg["show_vehicle_brand_as_name"]:
-                vname = self.cfg.user.brands.get(curr[0], curr[0])
-            else:
-                vname = curr[0]
-
-            if self.wcfg["vehicle_name_uppercase"]:
-                text = vname.upper()
-            else:
-                text = vname
-
-            if self.wcfg["vehicle_name_align_center"]:
-                text = text[:self.veh_width]
-            else:
-                text = text[:self.veh_width].ljust(self.veh_width)
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(color)
+            if curr[0] != last[0]:
+                target_bar.setText(self.format_vehicle_name(curr[0]))
+            if curr[1:] != last[1:]:
+                if curr[2]:  # highlight player
+                    color = self.bar_style_veh[3]
+                elif curr[1] > 0:
+                    color = self.bar_style_veh[1]
+                elif curr[1] < 0:
+                    color = self.bar_style_veh[2]
+                else:
+                    color = self.bar_style_veh[0]
+                target_bar.setStyleSheet(color)
 
     def update_brd(self, target_bar, curr, last):
         """Brand logo"""
         if curr != last:
-            if curr[0]:
-                brand_name = self.cfg.user.brands.get(curr[0], curr[0])
-            else:
-                brand_name = "blank"
-            # Draw brand logo
-            target_bar.setPixmap(self.load_brand_logo(brand_name))
-            # Draw background
-            target_bar.setStyleSheet(self.bar_style_brd[curr[2]])
+            if curr[0] != last[0]:
+                if curr[0]:
+                    brand_name = self.cfg.user.brands.get(curr[0], curr[0])
+                else:
+                    brand_name = "blank"
+                # Draw brand logo
+                target_bar.setPixmap(self.load_brand_logo(brand_name))
+            if curr[2] != last[2]:
+                # Draw background
+                target_bar.setStyleSheet(self.bar_style_brd[curr[2]])
 
     def update_gap(self, target_bar, curr, last):
         """Time gap"""
         if curr != last:
-            if curr[2]:  # highlight player
-                color = (f"color: {self.wcfg['font_color_player_time_gap']};"
-                         f"background: {self.wcfg['bkg_color_player_time_gap']};")
-            elif self.wcfg["show_lap_difference"]:
-                color = (f"color: {self.color_lap_diff(curr[1])};"
-                         f"background: {self.wcfg['bkg_color_time_gap']};")
-            else:
-                color = (f"color: {self.wcfg['font_color_time_gap']};"
-                         f"background: {self.wcfg['bkg_color_time_gap']};")
-
-            if curr[0] != "":
-                text = f"{curr[0]:.{self.gap_decimals}f}"[:self.gap_width].strip(
-                        ".").rjust(self.gap_width)
-            else:
-                text = ""
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(color)
+            if curr[0] != last[0]:
+                if curr[0] != "":
+                    text = f"{curr[0]:.{self.gap_decimals}f}"[:self.gap_width].strip(
+                            ".").rjust(self.gap_width)
+                else:
+                    text = ""
+                target_bar.setText(text)
+            if curr[1:] != last[1:]:
+                if curr[2]:  # highlight player
+                    color = self.bar_style_gap[3]
+                elif curr[1] > 0:
+                    color = self.bar_style_gap[1]
+                elif curr[1] < 0:
+                    color = self.bar_style_gap[2]
+                else:
+                    color = self.bar_style_gap[0]
+                target_bar.setStyleSheet(color)
 
     def update_lpt(self, target_bar, curr, last):
         """Vehicle laptime"""
         if curr != last:
-            if curr[0] != "":
-                text = self.set_laptime(*curr[0])
-            else:
-                text = ""
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(self.bar_style_lpt[curr[1]])
+            if curr[0] != last[0]:
+                if curr[0] != "":
+                    text = self.set_laptime(*curr[0])
+                else:
+                    text = ""
+                target_bar.setText(text)
+            if curr[1] != last[1]:
+                target_bar.setStyleSheet(self.bar_style_lpt[curr[1]])
 
     def update_pic(self, target_bar, curr, last):
         """Position in class"""
         if curr != last:
-            if curr[0] != "":
-                text = f"{curr[0]:02d}"
-            else:
-                text = ""
-
-            target_bar.setText(text)
-            target_bar.setStyleSheet(self.bar_style_pic[curr[1]])
+            if curr[0] != last[0]:
+                if curr[0] != "":
+                    text = f"{curr[0]:02d}"
+                else:
+                    text = ""
+                target_bar.setText(text)
+            if curr[1] != last[1]:
+                target_bar.setStyleSheet(self.bar_style_pic[curr[1]])
 
     def update_cls(self, target_bar, curr, last):
         """Vehicle class"""
         if curr != last:
-            text, bg_color = self.set_class_style(curr)
-            target_bar.setText(text[:self.cls_width])
-            target_bar.setStyleSheet(
-                f"color: {self.wcfg['font_color_class']};background: {bg_color};")
+            if curr not in self.class_style:
+                text, bg_color = self.set_class_style(curr)
+                self.class_style[curr] = text[:self.cls_width], self.set_qss(
+                    fg_color=self.wcfg["font_color_class"],
+                    bg_color=bg_color)
+            text, color = self.class_style[curr]
+            target_bar.setText(text)
+            target_bar.setStyleSheet(color)
 
     def update_pit(self, target_bar, curr, last):
         """Vehicle in pit"""
@@ -500,42 +431,98 @@ class Realtime(Overlay):
     def update_tcp(self, target_bar, curr, last):
         """Tyre compound index"""
         if curr != last:
-            target_bar.setText(self.set_tyre_cmp(curr[0]))
-            target_bar.setStyleSheet(self.bar_style_tcp[curr[1]])
+            if curr[0] != last[0]:
+                target_bar.setText(self.set_tyre_cmp(curr[0]))
+            if curr[1] != last[1]:
+                target_bar.setStyleSheet(self.bar_style_tcp[curr[1]])
 
     def update_psc(self, target_bar, curr, last):
         """Pitstop count"""
         if curr != last:
-            if self.wcfg["show_pit_request"] and curr[1] == 1:
-                color = self.bar_style_psc[2]
-            elif curr[2]:  # highlight player
-                color = self.bar_style_psc[1]
-            else:
-                color = self.bar_style_psc[0]
-
-            target_bar.setText(self.set_pitcount(curr[0]))
-            target_bar.setStyleSheet(color)
+            if curr[0] != last[0]:
+                target_bar.setText(self.set_pitcount(curr[0]))
+            if curr[1:] != last[1:]:
+                if self.show_pit_request and curr[1] == 1:
+                    color = self.bar_style_psc[2]
+                elif curr[2]:  # highlight player
+                    color = self.bar_style_psc[1]
+                else:
+                    color = self.bar_style_psc[0]
+                target_bar.setStyleSheet(color)
 
     # GUI generate methods
-    def set_table(self, name: str, style: str, width: int, column: int):
+    def set_table(self, style: str, width: int, column: int):
         """Set table"""
-        for idx in range(self.veh_range):
-            bar_name = f"{idx}_{name}"
-            self.data_bar[bar_name] = self.set_qlabel(
-                text="",
-                style=style,
-                width=width,
+        bar_set = self.set_qlabel(
+            text="",
+            style=style,
+            width=width,
+            count=self.veh_range,
+        )
+        for idx, target_bar in enumerate(bar_set):
+            self.layout().addWidget(target_bar, idx, column)
+        return bar_set
+
+    def set_lap_diff_style(self, suffix: str):
+        """Set lap difference style
+
+        Returns:
+            Style tuple: 0 same lap, 1 laps ahead, 2 laps behind, 3 player.
+        """
+        if self.wcfg["show_lap_difference"]:
+            fg_colors = (
+                self.wcfg["font_color_same_lap"],
+                self.wcfg["font_color_laps_ahead"],
+                self.wcfg["font_color_laps_behind"],
             )
-            self.layout().addWidget(self.data_bar[bar_name], idx, column)
+        else:
+            fg_colors = (self.wcfg[f"font_color_{suffix}"],) * 3
+        bg_color = self.wcfg[f"bkg_color_{suffix}"]
+        return (
+            *(self.set_qss(fg_color=fg_color, bg_color=bg_color) for fg_color in fg_colors),
+            self.set_qss(
+                fg_color=self.wcfg[f"font_color_player_{suffix}"],
+                bg_color=self.wcfg[f"bkg_color_player_{suffix}"])
+        )
 
     # Additional methods
-    def color_lap_diff(self, is_lapped):
-        """Compare lap differences & set color"""
-        if is_lapped > 0:
-            return self.wcfg["font_color_laps_ahead"]
-        if is_lapped < 0:
-            return self.wcfg["font_color_laps_behind"]
-        return self.wcfg["font_color_same_lap"]
+    def format_driver_name(self, name):
+        """Format driver name, cached by raw name"""
+        text = self.driver_name_text.get(name)
+        if text is None:
+            if self.wcfg["driver_name_shorten"]:
+                text = fmt.shorten_driver_name(name)
+            else:
+                text = name
+
+            if self.wcfg["driver_name_uppercase"]:
+                text = text.upper()
+
+            if self.wcfg["driver_name_align_center"]:
+                text = text[:self.drv_width]
+            else:
+                text = text[:self.drv_width].ljust(self.drv_width)
+            self.driver_name_text[name] = text
+        return text
+
+    def format_vehicle_name(self, name):
+        """Format vehicle name, cached by raw name"""
+        text = self.vehicle_name_text.get(name)
+        if text is None:
+            if self.wcfg["show_vehicle_brand_as_name"]:
+                text = self.cfg.user.brands.get(name, name)
+            else:
+                text = name
+
+            if self.wcfg["vehicle_name_uppercase"]:
+                text = text.upper()
+
+            if self.wcfg["vehicle_name_align_center"]:
+                text = text[:self.veh_width]
+            else:
+                text = text[:self.veh_width].ljust(self.veh_width)
+            self.vehicle_name_text[name] = text
+        return text
 
     def load_brand_logo(self, brand_name):
         """Load brand logo"""
@@ -560,7 +547,7 @@ class Realtime(Overlay):
     def set_tyre_cmp(self, tc_indices):
         """Substitute tyre compound index with custom chars"""
         if tc_indices:
-            return "".join((self.tyre_compound_string[idx] for idx in tc_indices))
+            return "".join(map(self.tyre_compound_string.__getitem__, tc_indices))
         return ""
 
     @staticmethod
@@ -591,48 +578,50 @@ class Realtime(Overlay):
 
     def get_data(self, index, veh_info):
         """Relative data"""
+        veh_data = veh_info[index]
+
         # Check whether is lapped (is_lapped: int)
-        is_lapped = veh_info[index].isLapped
+        is_lapped = veh_data.isLapped
 
         # Highlighted player (hi_player: bool)
-        hi_player = self.wcfg["show_player_highlighted"] and veh_info[index].isPlayer
+        hi_player = self.show_player_highlighted and veh_data.isPlayer
 
         # 0 Vehicle in pit (in_pit: bool)
-        in_pit = veh_info[index].inPit
+        in_pit = veh_data.inPit
 
         # 1 Driver position (position: int, is_lapped, hi_player)
-        position = (veh_info[index].positionOverall, is_lapped, hi_player)
+        position = (veh_data.positionOverall, is_lapped, hi_player)
 
         # 2 Driver name (drv_name: str, is_lapped, hi_player)
-        drv_name = (veh_info[index].driverName, is_lapped, hi_player)
+        drv_name = (veh_data.driverName, is_lapped, hi_player)
 
         # 3 Vehicle name (veh_name: str, is_lapped, hi_player)
-        veh_name = (veh_info[index].vehicleName, is_lapped, hi_player)
+        veh_name = (veh_data.vehicleName, is_lapped, hi_player)
 
         # 4 Position in class (pos_class: int, hi_player)
-        pos_class = (veh_info[index].positionInClass, hi_player)
+        pos_class = (veh_data.positionInClass, hi_player)
 
         # 5 Vehicle class (veh_class: str)
-        veh_class = veh_info[index].vehicleClass
+        veh_class = veh_data.vehicleClass
 
         # 6 Time gap (time_gap: float, is_lapped, hi_player)
-        time_gap = (veh_info[index].relativeTimeGap, is_lapped, hi_player)
+        time_gap = (round(veh_data.relativeTimeGap, self.gap_decimals), is_lapped, hi_player)
 
         # 7 Tyre compound index (tire_idx: tuple, hi_player)
-        tire_idx = (veh_info[index].tireCompound, hi_player)
+        tire_idx = (tuple(veh_data.tireCompound), hi_player)
 
         # 8 Lap time (laptime: tuple, hi_player)
         laptime = ((
-                veh_info[index].inPit,
-                veh_info[index].lastLapTime,
-                veh_info[index].pitTimer[2]
+                veh_data.inPit,
+                veh_data.lastLapTime,
+                veh_data.pitTimer[2]
             ),
             hi_player)
 
         # 9 Pitstop count (pit_count: int, pit_state: int, hi_player)
         pit_count = (
-            veh_info[index].numPitStops,
-            veh_info[index].pitState,
+            veh_data.numPitStops,
+            veh_data.pitState,
             hi_player)
 
         return (in_pit, position, drv_name, veh_name, pos_class, veh_class,
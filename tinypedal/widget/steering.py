@@ -87,13 +87,15 @@ class Realtime(Overlay):
         self.pixmap_mark = QPixmap(full_width, self.bar_height)
 
         self.pen = QPen()
+        self.pen.setColor(self.wcfg["font_color"])
         self.brush = QBrush(Qt.SolidPattern)
+        self.brush.setColor(self.wcfg["steering_color"])
         self.draw_background()
         self.draw_scale_mark()
 
         # Last data
         self.raw_steering = 0
-        self.last_raw_steering = None
+        self.last_steering = None
         self.sw_rot_range = 1
         self.last_sw_rot_range = 0
 
@@ -119,10 +121,15 @@ class Realtime(Overlay):
                     self.bar_width
                 )
                 self.draw_scale_mark(mark_gap, mark_num)
+                self.update()
 
-            # Steering
-            self.update_steering(self.raw_steering, self.last_raw_steering)
-            self.last_raw_steering = self.raw_steering
+            # Steering (bar width in pixel, angle in degree)
+            steering = (
+                round(self.raw_steering * self.bar_width),
+                round(self.raw_steering * self.sw_rot_range * 0.5),
+            )
+            self.update_steering(steering, self.last_steering)
+            self.last_steering = steering
 
     # GUI update methods
     def update_steering(self, curr, last):
@@ -166,38 +173,27 @@ class Realtime(Overlay):
         brush.setColor(self.wcfg["scale_mark_color"])
         painter.setBrush(brush)
         if mark_num:
-            for idx in range(mark_num):
-                painter.drawRect(
-                    self.bar_edge + self.bar_width - mark_gap * (idx + 1),
-                    0, 1, self.bar_height
-                )
-                painter.drawRect(
-                    self.bar_edge + self.bar_width + mark_gap * (idx + 1),
-                    0, 1, self.bar_height
-                )
+            center = self.bar_edge + self.bar_width
+            painter.drawRects([
+                QRectF(center + mark_gap * idx * sign, 0, 1, self.bar_height)
+                for idx in range(1, mark_num + 1)
+                for sign in (-1, 1)
+            ])
 
     def draw_steering(self, painter):
         """Draw steering"""
         painter.setPen(Qt.NoPen)
-        self.brush.setColor(self.wcfg["steering_color"])
         painter.setBrush(self.brush)
         painter.drawRect(
             self.bar_edge + self.bar_width + min(self.raw_steering, 0) * self.bar_width,
             0,
-            -min(self.raw_steering, 0) * self.bar_width,
-            self.bar_height
-        )
-        painter.drawRect(
-            self.bar_edge + self.bar_width,
-            0,
-            max(self.raw_steering, 0) * self.bar_width,
+            abs(self.raw_steering) * self.bar_width,
             self.bar_height
         )
 
     def draw_readings(self, painter):
         """Draw readings"""
         angle = round(self.raw_steering * self.sw_rot_range * 0.5)
-        self.pen.setColor(self.wcfg["font_color"])
         painter.setPen(self.pen)
         painter.setFont(self.font)
         painter.drawText(
@@ -53,11 +53,25 @@ class Realtime(Overlay):
         ))
         max_samples = 3 + max_line_width  # 3 offset + max line width
         self.samples_offset = max_samples - 2
+        self.max_steady_frames = self.display_width // self.display_scale + max_samples
         self.pedal_max_range = self.display_height
         self.area_width = self.display_width
         self.area_height = self.display_height + self.margin * 2
         self.draw_queue = self.config_draw_order()
 
+        self.enable_antialiasing = self.wcfg["enable_antialiasing"]
+        self.show_throttle = self.wcfg["show_throttle"]
+        self.show_raw_throttle = self.wcfg["show_raw_throttle"]
+        self.show_brake = self.wcfg["show_brake"]
+        self.show_raw_brake = self.wcfg["show_raw_brake"]
+        self.show_clutch = self.wcfg["show_clutch"]
+        self.show_raw_clutch = self.wcfg["show_raw_clutch"]
+        self.show_ffb = self.wcfg["show_ffb"]
+        self.show_wheel_lock = self.wcfg["show_wheel_lock"]
+        self.wheel_lock_threshold = self.wcfg["wheel_lock_threshold"]
+        self.show_wheel_slip = self.wcfg["show_wheel_slip"]
+        self.wheel_slip_threshold = self.wcfg["wheel_slip_threshold"]
+
         # Config canvas
         self.resize(self.area_width, self.area_height)
         self.rect_viewport = self.set_viewport_orientation()
@@ -66,7 +80,7 @@ class Realtime(Overlay):
         self.pixmap_plot = QPixmap(self.area_width, self.area_height)
         self.pixmap_plot_section = QPixmap(self.area_width, self.area_height)
         self.pixmap_plot_last = QPixmap(self.area_width, self.area_height)
-        self.pixmap_plot_last.fill(Qt.transparent)
+        self.pixmap_plot.fill(Qt.transparent)
 
         if self.wcfg["show_throttle"]:
             self.data_throttle = self.create_data_samples(max_samples)
@@ -81,6 +95,8 @@ class Realtime(Overlay):
         if self.wcfg["show_wheel_slip"]:
             self.data_wheel_slip = self.create_data_samples(max_samples)
 
+        self.plot_queue = self.config_plot_queue()
+
         self.pen = QPen()
         self.pen.setCapStyle(Qt.RoundCap)
         self.draw_background()
@@ -89,6 +105,8 @@ class Realtime(Overlay):
 
         # Last data
         self.delayed_update = False
+        self.sample_changed = False
+        self.steady_frames = 0
         self.last_lap_etime = -1
         self.update_plot = 1
 
@@ -106,51 +124,60 @@ class Realtime(Overlay):
             self.last_lap_etime = lap_etime
 
             if self.update_plot:
-                if self.wcfg["show_throttle"]:
-                    if self.wcfg["show_raw_throttle"]:
+                if self.show_throttle:
+                    if self.show_raw_throttle:
                         throttle = api.read.input.throttle_raw()
                     else:
                         throttle = api.read.input.throttle()
                     self.update_sample(self.data_throttle, throttle)
 
-                if self.wcfg["show_brake"]:
-                    if self.wcfg["show_raw_brake"]:
+                if self.show_brake:
+                    if self.show_raw_brake:
                         brake = api.read.input.brake_raw()
                     else:
                         brake = api.read.input.brake()
                     self.update_sample(self.data_brake, brake)
 
-                if self.wcfg["show_clutch"]:
-                    if self.wcfg["show_raw_clutch"]:
+                if self.show_clutch:
+                    if self.show_raw_clutch:
                         clutch = api.read.input.clutch_raw()
                     else:
                         clutch = api.read.input.clutch()
                     self.update_sample(self.data_clutch, clutch)
 
-                if self.wcfg["show_ffb"]:
+                if self.show_ffb:
                     ffb = abs(api.read.input.force_feedback())
                     self.update_sample(self.data_ffb, ffb)
 
-                if self.wcfg["show_wheel_lock"]:
-                    wheel_lock = min(abs(min(minfo.wheels.slipRatio)), 1)
-                    if wheel_lock < self.wcfg["wheel_lock_threshold"] or api.read.input.brake_raw() <= 0.02:
-                        wheel_lock = -999
+                if self.show_wheel_lock:
+                    wheel_lock = -999
+                    if api.read.input.brake_raw() > 0.02:
+                        slip_ratio = min(abs(min(minfo.wheels.slipRatio)), 1)
+                        if slip_ratio >= self.wheel_lock_threshold:
+                            wheel_lock = slip_ratio
                     self.update_sample(self.data_wheel_lock, wheel_lock)
 
-                if self.wcfg["show_wheel_slip"]:
-                    wheel_slip = min(max(minfo.wheels.slipRatio), 1)
-                    if wheel_slip < self.wcfg["wheel_slip_threshold"] or api.read.input.throttle_raw() <= 0.02:
-                        wheel_slip = -999
+                if self.show_wheel_slip:
+                    wheel_slip = -999
+                    if api.read.input.throttle_raw() > 0.02:
+                        slip_ratio = min(max(minfo.wheels.slipRatio), 1)
+                        if slip_ratio >= self.wheel_slip_threshold:
+                            wheel_slip = slip_ratio
                     self.update_sample(self.data_wheel_slip, wheel_slip)
 
                 # Update after all pedal data set
                 if self.delayed_update:
                     self.delayed_update = False
-                    self.draw_plot_section()
-                    self.draw_plot()
-                    self.pixmap_plot_last = self.pixmap_plot.copy(
-                        0, 0, self.area_width, self.area_height)
-                    self.update()  # trigger paint event
+                    if self.sample_changed:
+                        self.sample_changed = False
+                        self.steady_frames = 0
+                    elif self.steady_frames <= self.max_steady_frames:
+                        self.steady_frames += 1
+                    # Skip redraw after unchanged samples scrolled through whole plot
+                    if self.steady_frames <= self.max_steady_frames:
+                        self.draw_plot_section()
+                        self.draw_plot()
+                        self.update()  # trigger paint event
 
     # GUI update methods
     def paintEvent(self, event):
@@ -168,67 +195,51 @@ class Realtime(Overlay):
         painter.setBrush(Qt.NoBrush)
 
         # Draw reference line
-        if self.wcfg["show_reference_line"]:
-            for idx in range(1, 6):
-                self.draw_reference_line(
-                    painter,
-                    self.wcfg[f"reference_line_{idx}_style"],
-                    self.wcfg[f"reference_line_{idx}_offset"],
-                    self.wcfg[f"reference_line_{idx}_width"],
-                    self.wcfg[f"reference_line_{idx}_color"]
-                )
-
-    def draw_reference_line(self, painter, style, offset, width, color):
-        """Draw reference line"""
-        if width > 0:
-            if style:
-                self.pen.setStyle(Qt.DashLine)
-            else:
-                self.pen.setStyle(Qt.SolidLine)
-            self.pen.setWidth(width)
-            self.pen.setColor(color)
+        for y_pos, line_width, line_color, line_style in self.config_reference_line():
+            self.pen.setStyle(line_style)
+            self.pen.setWidth(line_width)
+            self.pen.setColor(line_color)
             painter.setPen(self.pen)
-            painter.drawLine(
-                0,
-                self.pedal_max_range * offset + self.margin,
-                self.display_width,
-                self.pedal_max_range * offset + self.margin,
-            )
+            painter.drawLine(0, y_pos, self.display_width, y_pos)
 
     def draw_plot(self):
-        """Draw final plot"""
-        self.pixmap_plot.fill(Qt.transparent)
-        painter = QPainter(self.pixmap_plot)
-        # Draw section plot
-        painter.drawPixmap(0, 0, self.pixmap_plot_section)
-        # Avoid overlapping previous frame
+        """Draw final plot
+
+        Render new frame into the spare pixmap from current plot,
+        then swap both, so the previous frame never needs copying.
+        """
+        painter = QPainter(self.pixmap_plot_last)
+        # Overwrite spare pixmap & avoid overlapping previous frame
         painter.setCompositionMode(QPainter.CompositionMode_Source)
+        # Draw section plot (full area, transparent outside section)
+        painter.drawPixmap(0, 0, self.pixmap_plot_section)
         # Draw last plot, +3 sample offset, -2 sample crop
         painter.drawPixmap(
-            self.display_scale * 3, 0, self.pixmap_plot_last,
+            self.display_scale * 3, 0, self.pixmap_plot,
             self.display_scale * 2, 0, 0 ,0)
+        painter.end()
+        self.pixmap_plot, self.pixmap_plot_last = self.pixmap_plot_last, self.pixmap_plot
 
     def draw_plot_section(self):
         """Draw section plot"""
         self.pixmap_plot_section.fill(Qt.transparent)
         painter = QPainter(self.pixmap_plot_section)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setRenderHint(QPainter.Antialiasing, self.enable_antialiasing)
         painter.setBrush(Qt.NoBrush)
         self.pen.setStyle(Qt.SolidLine)
 
-        for plot_name in self.draw_queue:
-            if self.wcfg[f"show_{plot_name}"]:
-                self.draw_line(painter, plot_name)
+        for dataset, line_width, line_color, line_style in self.plot_queue:
+            self.draw_line(painter, dataset, line_width, line_color, line_style)
 
-    def draw_line(self, painter, suffix):
+    def draw_line(self, painter, dataset, line_width, line_color, line_style):
         """Draw plot line"""
-        self.pen.setWidth(self.wcfg[f"{suffix}_line_width"])
-        self.pen.setColor(self.wcfg[f"{suffix}_color"])
+        self.pen.setWidth(line_width)
+        self.pen.setColor(line_color)
         painter.setPen(self.pen)
-        if self.wcfg[f"{suffix}_line_style"]:
-            painter.drawPoints(getattr(self, f"data_{suffix}"))
+        if line_style:
+            painter.drawPoints(dataset)
         else:
-            painter.drawPolyline(getattr(self, f"data_{suffix}"))
+            painter.drawPolyline(dataset)
 
     # Additional methods
     def create_data_samples(self, max_samples):
@@ -239,7 +250,10 @@ class Realtime(Overlay):
     def update_sample(self, dataset, value):
         """Update input position samples"""
         # Scale & set new input position
-        dataset[0].setY(value * self.display_height + self.margin)
+        pos_y = value * self.display_height + self.margin
+        if dataset[0].y() != pos_y:
+            self.sample_changed = True
+        dataset[0].setY(pos_y)
         # Move old input data (Y) 1 display unit to right
         for index in range(self.samples_offset, -1, -1):
             dataset[index + 1].setY(dataset[index].y())
@@ -272,3 +286,31 @@ class Realtime(Overlay):
             (self.wcfg["draw_order_index_wheel_slip"], "wheel_slip"),
         )
         return tuple(zip(*sorted(plot_list, reverse=True)))[1]
+
+    def config_plot_queue(self):
+        """Config plot queue (dataset, line width, line color, line style) in draw order"""
+        return tuple(
+            (
+                getattr(self, f"data_{plot_name}"),
+                self.wcfg[f"{plot_name}_line_width"],
+                self.wcfg[f"{plot_name}_color"],
+                self.wcfg[f"{plot_name}_line_style"],
+            )
+            for plot_name in self.draw_queue
+            if self.wcfg[f"show_{plot_name}"]
+        )
+
+    def config_reference_line(self):
+        """Config reference line (y position, line width, line color, line style)"""
+        if not self.wcfg["show_reference_line"]:
+            return ()
+        return tuple(
+            (
+                self.pedal_max_range * self.wcfg[f"reference_line_{idx}_offset"] + self.margin,
+                self.wcfg[f"reference_line_{idx}_width"],
+                self.wcfg[f"reference_line_{idx}_color"],
+                Qt.DashLine if self.wcfg[f"reference_line_{idx}_style"] else Qt.SolidLine,
+            )
+            for idx in range(1, 6)
+            if self.wcfg[f"reference_line_{idx}_width"] > 0
+        )
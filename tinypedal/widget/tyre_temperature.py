@@ -20,6 +20,8 @@
 Tyre temperature Widget
 """
 
+from bisect import bisect_right
+
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
@@ -49,7 +51,15 @@ class Realtime(Overlay):
         inner_gap = self.wcfg["inner_gap"]
         self.leading_zero = min(max(self.wcfg["leading_zero"], 1), 3)
         self.sign_text = "°" if self.wcfg["show_degree_sign"] else ""
+
+        if self.cfg.units["temperature_unit"] == "Fahrenheit":
+            self.round_temperature = self.round_fahrenheit
+        else:
+            self.round_temperature = round
         self.tyre_compound_string = self.cfg.units["tyre_compound_symbol"].ljust(20, "?")
+        self.show_tyre_compound = self.wcfg["show_tyre_compound"]
+        self.show_inner_center_outer = self.wcfg["show_inner_center_outer"]
+        self.show_innerlayer = self.wcfg["show_innerlayer"]
 
         text_width = 3 + len(self.sign_text) + (self.cfg.units["temperature_unit"] == "Fahrenheit")
         bar_width_ttemp = font_m.width * text_width + bar_padx
@@ -57,6 +67,11 @@ class Realtime(Overlay):
 
         # Base style
         self.heatmap = hmp.load_heatmap(self.wcfg["heatmap_name"], "tyre_default")
+        self.heatmap_temp, self.heatmap_color = zip(*self.heatmap)
+        self.bar_style_heatmap_stemp = self.set_heatmap_style(
+            self.wcfg["font_color_surface"], self.wcfg["bkg_color_surface"])
+        self.bar_style_heatmap_itemp = self.set_heatmap_style(
+            self.wcfg["font_color_innerlayer"], self.wcfg["bkg_color_innerlayer"])
         self.setStyleSheet(self.set_qss(
             font_family=self.wcfg["font_name"],
             font_size=self.wcfg["font_size"],
@@ -130,94 +145,102 @@ class Realtime(Overlay):
                 self.set_layout_vert(layout_itemp, bar_blank)
 
         # Last data
-        self.last_tcmpd = [None] * 2
+        self.last_tcmpd = (None, None)
         self.last_stemp = self.create_last_data()
         self.last_itemp = self.create_last_data()
+        self.last_color_stemp = self.create_last_data(None)
+        self.last_color_itemp = self.create_last_data(None)
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
 
             # Tyre compound
-            if self.wcfg["show_tyre_compound"]:
+            if self.show_tyre_compound:
                 tcmpd = api.read.tyre.compound()
-                for cmpd_idx in range(2):
-                    self.update_tcmpd(
-                        self.bar_tcmpd[cmpd_idx],
-                        tcmpd[cmpd_idx],
-                        self.last_tcmpd[cmpd_idx]
-                    )
-                    self.last_tcmpd[cmpd_idx] = tcmpd[cmpd_idx]
+                if tcmpd != self.last_tcmpd:
+                    for cmpd_idx in range(2):
+                        self.update_tcmpd(
+                            self.bar_tcmpd[cmpd_idx],
+                            tcmpd[cmpd_idx],
+                            self.last_tcmpd[cmpd_idx]
+                        )
+                    self.last_tcmpd = tcmpd
 
-            if self.wcfg["show_inner_center_outer"]:
+            if self.show_inner_center_outer:
                 # Surface temperature
                 stemp = api.read.tyre.surface_temperature_ico()
-                for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
-                    for patch_idx in range(3):  # 0 1 2 / 7 8 9
-                        self.update_stemp(
-                            self.bar_stemp[tyre_idx][patch_idx],
-                            stemp[tyre_idx][patch_idx],
-                            self.last_stemp[tyre_idx][patch_idx]
+                stemp_rounded = tuple(tuple(map(self.round_temperature, data)) for data in stemp)
+                if stemp_rounded != self.last_stemp:
+                    for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
+                        self.update_ttemp(
+                            zip(
+                                self.bar_stemp[tyre_idx],
+                                stemp[tyre_idx],
+                                stemp_rounded[tyre_idx],
+                                self.last_stemp[tyre_idx],
+                            ),
+                            self.last_color_stemp[tyre_idx],
+                            self.bar_style_heatmap_stemp,
                         )
-                        self.last_stemp[tyre_idx][patch_idx] = stemp[tyre_idx][patch_idx]
+                    self.last_stemp = stemp_rounded
 
                 # Inner layer temperature
-                if self.wcfg["show_innerlayer"]:
+                if self.show_innerlayer:
                     itemp = api.read.tyre.inner_temperature_ico()
-                    for tyre_idx in range(4):
-                        for patch_idx in range(3):
-                            self.update_itemp(
-                                self.bar_itemp[tyre_idx][patch_idx],
-                                itemp[tyre_idx][patch_idx],
-                                self.last_itemp[tyre_idx][patch_idx]
+                    itemp_rounded = tuple(
+                        tuple(map(self.round_temperature, data)) for data in itemp)
+                    if itemp_rounded != self.last_itemp:
+                        for tyre_idx in range(4):
+                            self.update_ttemp(
+                                zip(
+                                    self.bar_itemp[tyre_idx],
+                                    itemp[tyre_idx],
+                                    itemp_rounded[tyre_idx],
+                                    self.last_itemp[tyre_idx],
+                                ),
+                                self.last_color_itemp[tyre_idx],
+                                self.bar_style_heatmap_itemp,
                             )
-                            self.last_itemp[tyre_idx][patch_idx] = itemp[tyre_idx][patch_idx]
+                        self.last_itemp = itemp_rounded
             else:
                 # Surface temperature
                 stemp = api.read.tyre.surface_temperature_avg()
-                for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
-                    self.update_stemp(
-                        self.bar_stemp[tyre_idx],
-                        stemp[tyre_idx],
-                        self.last_stemp[tyre_idx]
+                stemp_rounded = tuple(map(self.round_temperature, stemp))
+                if stemp_rounded != self.last_stemp:
+                    self.update_ttemp(
+                        zip(self.bar_stemp, stemp, stemp_rounded, self.last_stemp),
+                        self.last_color_stemp,
+                        self.bar_style_heatmap_stemp,
                     )
-                    self.last_stemp[tyre_idx] = stemp[tyre_idx]
+                    self.last_stemp = stemp_rounded
 
                 # Inner layer temperature
-                if self.wcfg["show_innerlayer"]:
+                if self.show_innerlayer:
                     itemp = api.read.tyre.inner_temperature_avg()
-                    for tyre_idx in range(4):
-                        self.update_itemp(
-                            self.bar_itemp[tyre_idx],
-                            itemp[tyre_idx],
-                            self.last_itemp[tyre_idx]
+                    itemp_rounded = tuple(map(self.round_temperature, itemp))
+                    if itemp_rounded != self.last_itemp:
+                        self.update_ttemp(
+                            zip(self.bar_itemp, itemp, itemp_rounded, self.last_itemp),
+                            self.last_color_itemp,
+                            self.bar_style_heatmap_itemp,
                         )
-                        self.last_itemp[tyre_idx] = itemp[tyre_idx]
+                        self.last_itemp = itemp_rounded
 
     # GUI update methods
-    def update_stemp(self, target_bar, curr, last):
-        """Tyre surface temperature"""
-        if round(curr) != round(last):
-            color_temp = hmp.select_color(self.heatmap, curr)
-            if self.wcfg["swap_style"]:
-                color = f"color: {self.wcfg['font_color_surface']};background: {color_temp};"
-            else:
-                color = f"color: {color_temp};background: {self.wcfg['bkg_color_surface']};"
+    def update_ttemp(self, bar_data, last_color, bar_style):
+        """Tyre temperature, compare rounded reading in display unit
 
-            target_bar.setText(self.format_temperature(curr))
-            target_bar.setStyleSheet(color)
-
-    def update_itemp(self, target_bar, curr, last):
-        """Tyre inner temperature"""
-        if round(curr) != round(last):
-            color_temp = hmp.select_color(self.heatmap, curr)
-            if self.wcfg["swap_style"]:
-                color = f"color: {self.wcfg['font_color_innerlayer']};background: {color_temp};"
-            else:
-                color = f"color: {color_temp};background: {self.wcfg['bkg_color_innerlayer']};"
-
-            target_bar.setText(self.format_temperature(curr))
-            target_bar.setStyleSheet(color)
+        Restyle only on heatmap color change.
+        bar_data: iterable of (target bar, reading, rounded reading, last rounded reading).
+        """
+        for idx, (target_bar, value, curr, last) in enumerate(bar_data):
+            if curr != last:
+                target_bar.setText(self.format_temperature(curr))
+                color_temp = self.select_heatmap_color(value)
+                if color_temp != last_color[idx]:
+                    last_color[idx] = color_temp
+                    target_bar.setStyleSheet(bar_style[color_temp])
 
     def update_tcmpd(self, target_bar, curr, last):
         """Tyre compound"""
@@ -227,7 +250,7 @@ class Realtime(Overlay):
     # GUI generate methods
     def set_table(self, text, style, width, layout):
         """Set table"""
-        if self.wcfg["show_inner_center_outer"]:
+        if self.show_inner_center_outer:
             bar_set = tuple(self.set_qlabel(
                 text=text,
                 style=style,
@@ -283,14 +306,33 @@ class Realtime(Overlay):
             layout.addWidget(bar_set[index], index + 1, 4)
 
     # Additional methods
+    def set_heatmap_style(self, font_color, bkg_color):
+        """Set heatmap style, map heatmap color to stylesheet"""
+        if self.wcfg["swap_style"]:
+            return {
+                color: self.set_qss(fg_color=font_color, bg_color=color)
+                for _, color in self.heatmap
+            }
+        return {
+            color: self.set_qss(fg_color=color, bg_color=bkg_color)
+            for _, color in self.heatmap
+        }
+
+    def select_heatmap_color(self, temperature):
+        """Select heatmap color, binary search sorted heatmap temperature"""
+        return self.heatmap_color[max(bisect_right(self.heatmap_temp, temperature) - 1, 0)]
+
     def format_temperature(self, value):
-        """Format temperature"""
-        if self.cfg.units["temperature_unit"] == "Fahrenheit":
-            return f"{calc.celsius2fahrenheit(value):0{self.leading_zero}.0f}{self.sign_text}"
-        return f"{value:0{self.leading_zero}.0f}{self.sign_text}"
+        """Format rounded temperature"""
+        return f"{value:0{self.leading_zero}d}{self.sign_text}"
+
+    @staticmethod
+    def round_fahrenheit(value):
+        """Round temperature - Fahrenheit"""
+        return round(calc.celsius2fahrenheit(value))
 
-    def create_last_data(self):
+    def create_last_data(self, value=-274):
         """Create last data list"""
-        if self.wcfg["show_inner_center_outer"]:
-            return [[-273.15] * 3 for _ in range(4)]
-        return [-273.15] * 4
+        if self.show_inner_center_outer:
+            return [[value] * 3 for _ in range(4)]
+        return [value] * 4
@@ -53,6 +53,15 @@ class Realtime(Overlay):
         icon_size = int(max(self.wcfg["icon_size"], 16) * 0.5) * 2
         self.bar_width = max(font_m.width * 4 + bar_padx, icon_size)
         self.bar_rain_height = max(self.wcfg["rain_chance_bar_height"], 1)
+        self.show_estimated_time = self.wcfg["show_estimated_time"]
+        self.show_ambient_temperature = self.wcfg["show_ambient_temperature"]
+        self.show_rain_chance_bar = self.wcfg["show_rain_chance_bar"]
+        self.show_unavailable_data = self.wcfg["show_unavailable_data"]
+
+        if self.cfg.units["temperature_unit"] == "Fahrenheit":
+            self.format_temperature = self.format_temperature_fahrenheit
+        else:
+            self.format_temperature = self.format_temperature_celsius
 
         # Base style
         self.setStyleSheet(self.set_qss(
@@ -70,10 +79,12 @@ class Realtime(Overlay):
 
         # Config canvas
         self.pixmap_weather = self.create_weather_icon_set(icon_size)
-        self.pixmap_rainchance = QPixmap(self.bar_width, self.bar_rain_height)
-        self.brush = QBrush(Qt.SolidPattern)
+        self.pixmap_rainchance = self.create_rain_chance_set()
 
-        self.data_bar = {}
+        self.bar_time = [None] * self.total_slot
+        self.bar_temp = [None] * self.total_slot
+        self.bar_rain = [None] * self.total_slot
+        self.bar_icon = [None] * self.total_slot
         self.set_table(width=self.bar_width)
 
         # Last data
@@ -114,49 +125,45 @@ class Realtime(Overlay):
                     time_text = "now"
                 else:
                     time_text = TEXT_NONE
-                name_time = f"time_{index}"
-                self.data_bar[name_time] = self.set_qlabel(
+                self.bar_time[index] = self.set_qlabel(
                     text=time_text,
                     style=bar_style_time,
                     fixed_width=width,
                 )
                 layout_inner[index].addWidget(
-                    self.data_bar[name_time], self.wcfg["column_index_estimated_time"], 0
+                    self.bar_time[index], self.wcfg["column_index_estimated_time"], 0
                 )
 
             # Ambient temperature
             if self.wcfg["show_ambient_temperature"]:
-                name_temp = f"temp_{index}"
-                self.data_bar[name_temp] = self.set_qlabel(
+                self.bar_temp[index] = self.set_qlabel(
                     text=TEXT_NONE,
                     style=bar_style_temp,
                     fixed_width=width,
                 )
                 layout_inner[index].addWidget(
-                    self.data_bar[name_temp], self.wcfg["column_index_ambient_temperature"], 0
+                    self.bar_temp[index], self.wcfg["column_index_ambient_temperature"], 0
                 )
 
             # Rain chance
             if self.wcfg["show_rain_chance_bar"]:
-                name_rain = f"rain_{index}"
-                self.data_bar[name_rain] = self.set_qlabel(
+                self.bar_rain[index] = self.set_qlabel(
                     style=bar_style_rain,
                     fixed_width=width,
                     fixed_height=self.bar_rain_height,
                 )
                 layout_inner[index].addWidget(
-                    self.data_bar[name_rain], self.wcfg["column_index_rain_chance_bar"], 0
+                    self.bar_rain[index], self.wcfg["column_index_rain_chance_bar"], 0
                 )
 
             # Forecast icon
-            name_icon = f"icon_{index}"
-            self.data_bar[name_icon] = self.set_qlabel(
+            self.bar_icon[index] = self.set_qlabel(
                 style=bar_style_icon,
                 fixed_width=width,
             )
-            self.data_bar[name_icon].setPixmap(self.pixmap_weather[-1])
+            self.bar_icon[index].setPixmap(self.pixmap_weather[-1])
             layout_inner[index].addWidget(
-                self.data_bar[name_icon], self.wcfg["column_index_weather_icon"], 0
+                self.bar_icon[index], self.wcfg["column_index_weather_icon"], 0
             )
 
             # Set layout
@@ -191,12 +198,14 @@ class Realtime(Overlay):
                         self.estimated_time[index] = wthr.MAX_MINUTES
             # Time type race, index offset to ignore negative estimated time
             else:
+                session_end = api.read.session.end()
+                session_elapsed = api.read.session.elapsed()
                 for index in range(forecast_count):
                     self.estimated_time[index] = min(round(
                         wthr.forecast_time_progress(
                             forecast_info[index][0],
-                            api.read.session.end(),
-                            api.read.session.elapsed()
+                            session_end,
+                            session_elapsed
                         ) / 60), wthr.MAX_MINUTES)
                     if self.estimated_time[index] <= 0 < index:
                         index_offset += 1
@@ -211,10 +220,8 @@ class Realtime(Overlay):
                     estimated_temp = api.read.session.ambient_temperature()
                 # Update slot with available forecast
                 elif index_bias < forecast_count:
-                    rain_chance = forecast_info[index_bias][3]
-                    icon_index = forecast_info[index_bias][1]
+                    _, icon_index, estimated_temp, rain_chance = forecast_info[index_bias]
                     estimated_time = self.estimated_time[index_bias]
-                    estimated_temp = forecast_info[index_bias][2]
                 # Update slot with unavailable forecast
                 else:
                     rain_chance = 0
@@ -226,20 +233,21 @@ class Realtime(Overlay):
                     icon_index, self.last_icon_index[index], index)
                 self.last_icon_index[index] = icon_index
 
-                if self.wcfg["show_estimated_time"] and index > 0:
+                if self.show_estimated_time and index > 0:
                     self.update_estimated_time(
                         estimated_time, self.last_estimated_time[index], index)
                     self.last_estimated_time[index] = estimated_time
 
-                if self.wcfg["show_ambient_temperature"]:
+                if self.show_ambient_temperature:
                     self.update_estimated_temp(
                         estimated_temp, self.last_estimated_temp[index], index)
                     self.last_estimated_temp[index] = estimated_temp
 
-                if self.wcfg["show_rain_chance_bar"]:
+                if self.show_rain_chance_bar:
+                    rain_percent = min(max(round(rain_chance), 0), 100)
                     self.update_rain_chance_bar(
-                        rain_chance, self.last_rain_chance[index], index)
-                    self.last_rain_chance[index] = rain_chance
+                        rain_percent, self.last_rain_chance[index], index)
+                    self.last_rain_chance[index] = rain_percent
 
     # GUI update methods
     def update_estimated_time(self, curr, last, index):
@@ -251,7 +259,7 @@ class Realtime(Overlay):
                 time_text = f"{curr / 60:.1f}h"
             else:
                 time_text = f"{curr:.0f}m"
-            self.data_bar[f"time_{index}"].setText(time_text)
+            self.bar_time[index].setText(time_text)
 
     def update_estimated_temp(self, curr, last, index):
         """Estimated temperature"""
@@ -260,35 +268,29 @@ class Realtime(Overlay):
                 temp_text = self.format_temperature(curr)
             else:
                 temp_text = TEXT_NONE
-            self.data_bar[f"temp_{index}"].setText(temp_text)
+            self.bar_temp[index].setText(temp_text)
 
     def update_rain_chance_bar(self, curr, last, index):
-        """Rain chance bar"""
+        """Rain chance bar, compare integer percent"""
         if curr != last:
-            self.pixmap_rainchance.fill(Qt.transparent)
-            painter = QPainter(self.pixmap_rainchance)
-            painter.setPen(Qt.NoPen)
-            self.brush.setColor(self.wcfg["rain_chance_bar_color"])
-            painter.setBrush(self.brush)
-            painter.drawRect(0, 0, curr * 0.01 * self.bar_width, self.bar_rain_height)
-            self.data_bar[f"rain_{index}"].setPixmap(self.pixmap_rainchance)
+            self.bar_rain[index].setPixmap(self.pixmap_rainchance[curr])
 
     def update_weather_icon(self, curr, last, index):
         """Weather icon, toggle visibility"""
         if curr != last:
             if 0 <= curr <= 10:
-                self.data_bar[f"icon_{index}"].setPixmap(self.pixmap_weather[curr])
+                self.bar_icon[index].setPixmap(self.pixmap_weather[curr])
             else:
-                self.data_bar[f"icon_{index}"].setPixmap(self.pixmap_weather[-1])
+                self.bar_icon[index].setPixmap(self.pixmap_weather[-1])
 
-            if not self.wcfg["show_unavailable_data"] and index > 0:  # skip first slot
-                self.toggle_visibility(curr, self.data_bar[f"icon_{index}"])
-                if self.wcfg["show_estimated_time"]:
-                    self.toggle_visibility(curr, self.data_bar[f"time_{index}"])
-                if self.wcfg["show_ambient_temperature"]:
-                    self.toggle_visibility(curr, self.data_bar[f"temp_{index}"])
-                if self.wcfg["show_rain_chance_bar"]:
-                    self.toggle_visibility(curr, self.data_bar[f"rain_{index}"])
+            if not self.show_unavailable_data and index > 0:  # skip first slot
+                self.toggle_visibility(curr, self.bar_icon[index])
+                if self.show_estimated_time:
+                    self.toggle_visibility(curr, self.bar_time[index])
+                if self.show_ambient_temperature:
+                    self.toggle_visibility(curr, self.bar_temp[index])
+                if self.show_rain_chance_bar:
+                    self.toggle_visibility(curr, self.bar_rain[index])
 
     # Additional methods
     @staticmethod
@@ -314,27 +316,48 @@ class Realtime(Overlay):
             return wthr.DEFAULT
         return info
 
-    def format_temperature(self, air_deg):
-        """Format ambient temperature"""
-        if self.cfg.units["temperature_unit"] == "Fahrenheit":
-            return f"{calc.celsius2fahrenheit(air_deg):.0f}°"
+    @staticmethod
+    def format_temperature_celsius(air_deg):
+        """Format ambient temperature - Celsius"""
         return f"{air_deg:.0f}°"
 
+    @staticmethod
+    def format_temperature_fahrenheit(air_deg):
+        """Format ambient temperature - Fahrenheit"""
+        return f"{calc.celsius2fahrenheit(air_deg):.0f}°"
+
+    def create_rain_chance_set(self):
+        """Create rain chance bar set, index by integer percent"""
+        brush = QBrush(Qt.SolidPattern)
+        brush.setColor(self.wcfg["rain_chance_bar_color"])
+        return tuple(
+            self.draw_rain_chance_bar(brush, percent * 0.01 * self.bar_width)
+            for percent in range(101))
+
+    def draw_rain_chance_bar(self, brush, bar_width):
+        """Draw rain chance bar"""
+        pixmap = QPixmap(self.bar_width, self.bar_rain_height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(brush)
+        painter.drawRect(0, 0, bar_width, self.bar_rain_height)
+        return pixmap
+
     def create_weather_icon_set(self, icon_size):
         """Create weather icon set"""
         icon_source = QPixmap("images/icon_weather.png")
         pixmap_icon = icon_source.scaledToWidth(icon_size * 12, mode=Qt.SmoothTransformation)
         rect_size = QRectF(0, 0, icon_size, icon_size)
         rect_offset = QRectF(0, 0, icon_size, icon_size)
-        return tuple(
-            self.draw_weather_icon(pixmap_icon, icon_size, rect_size, rect_offset, index)
-            for index in range(12))
-
-    def draw_weather_icon(self, pixmap_icon, icon_size, rect_size, rect_offset, h_offset):
-        """Draw weather icon"""
-        pixmap = QPixmap(icon_size, icon_size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        rect_offset.moveLeft(icon_size * h_offset)
-        painter.drawPixmap(rect_size, pixmap_icon, rect_offset)
-        return pixmap
+        painter = QPainter()
+        icon_set = []
+        for index in range(12):
+            pixmap = QPixmap(icon_size, icon_size)
+            pixmap.fill(Qt.transparent)
+            painter.begin(pixmap)
+            rect_offset.moveLeft(icon_size * index)
+            painter.drawPixmap(rect_size, pixmap_icon, rect_offset)
+            painter.end()
+            icon_set.append(pixmap)
+        return tuple(icon_set)